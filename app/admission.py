@@ -0,0 +1,177 @@
+#File: app/admission.py
+"""
+Admission control and load shedding.
+
+Caps the number of requests in flight, per budget and per route. A request
+arriving with no free capacity is rejected immediately with
+503 Service Unavailable and a ``Retry-After`` header. The alternative is to
+queue it behind the threadpool until it times out, which adds latency for
+everyone.
+
+Phase 1 and Phase 2 routes (``PHASE_ROUTES``) each draw from their own
+budget; every other route shares the global one. A surge of slow document
+analyses can therefore never shed application submissions, mirroring the
+per-phase bulkheads behind them.
+
+``/health`` probes and ``/debug`` profiling captures are never shed or
+counted. Requests carrying a positive ``Retry-Attempt`` header may use a
+small reserved headroom above the global limit, so a client that already
+failed once does not get shed again.
+"""
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.scheduling import PHASE1, PHASE2
+
+EXEMPT_PREFIXES = ("/health", "/debug")
+RETRY_HEADER = "retry-attempt"
+
+PHASE_ROUTES = {
+    "/submit/application": PHASE1,
+    "/submit/applications/stream": PHASE1,
+    "/analyze/tech-documents": PHASE2,
+    "/analyze/tech-documents/stream": PHASE2,
+}
+
+
+class AdmissionController:
+    """
+        In-flight request accounting shared by the middleware and load probe.
+
+        All mutation happens on the event loop thread, so plain counters are
+        sufficient.
+
+        Args:
+            max_inflight: Global limit on concurrently admitted requests for
+                routes without a phase.
+            route_limits: Per-path limits applied in addition to the budget.
+            retry_headroom: Extra slots per budget reserved for retried requests.
+            retry_after: Seconds advertised in ``Retry-After`` when shedding.
+            phase_limits: Separate budget per phase, for the routes mapped to
+                it in ``phase_routes``.
+            phase_routes: Mapping of request path to phase.
+        """
+
+    def __init__(self, max_inflight: int, route_limits: dict[str, int] | None = None,
+                 retry_headroom: int = 0, retry_after: int = 1,
+                 phase_limits: dict[str, int] | None = None, phase_routes: dict[str, str] | None = None):
+        self.max_inflight = max_inflight
+        self.route_limits = route_limits or {}
+        self.retry_headroom = retry_headroom
+        self.retry_after = retry_after
+        self.phase_limits = phase_limits or {}
+        self.phase_routes = {path: phase for path, phase in (phase_routes or {}).items() if phase in self.phase_limits}
+        self.in_flight = 0
+        self.phase_in_flight: dict[str, int] = {phase: 0 for phase in self.phase_limits}
+        self.route_in_flight: dict[str, int] = {path: 0 for path in self.route_limits}
+        self.shed_total = 0
+
+    def try_admit(self, path: str, retried: bool) -> bool:
+        """Reserve capacity for a request; returns False when it must be shed."""
+        headroom = self.retry_headroom if retried else 0
+        phase = self.phase_routes.get(path)
+        if phase is None:
+            budget_full = self.in_flight >= self.max_inflight + headroom
+        else:
+            budget_full = self.phase_in_flight[phase] >= self.phase_limits[phase] + headroom
+        route_limit = self.route_limits.get(path)
+        if budget_full or (route_limit is not None and self.route_in_flight[path] >= route_limit):
+            self.shed_total += 1
+            return False
+        if phase is None:
+            self.in_flight += 1
+        else:
+            self.phase_in_flight[phase] += 1
+        if route_limit is not None:
+            self.route_in_flight[path] += 1
+        return True
+
+    def release(self, path: str) -> None:
+        """Return capacity reserved by :meth:`try_admit`."""
+        phase = self.phase_routes.get(path)
+        if phase is None:
+            self.in_flight -= 1
+        else:
+            self.phase_in_flight[phase] -= 1
+        if path in self.route_in_flight:
+            self.route_in_flight[path] -= 1
+
+    @property
+    def saturated(self) -> bool:
+        """True while the global budget or any phase budget is full."""
+        return self.in_flight >= self.max_inflight or any(
+            self.phase_in_flight[phase] >= limit for phase, limit in self.phase_limits.items()
+        )
+
+    def snapshot(self) -> dict:
+        """Return current load for load balancers and dashboards."""
+        return {
+            "in_flight": self.in_flight,
+            "capacity": self.max_inflight,
+            "utilization": round(self.in_flight / self.max_inflight, 3) if self.max_inflight else 1.0,
+            "saturated": self.saturated,
+            "shed_total": self.shed_total,
+            "phases": {
+                phase: {
+                    "in_flight": self.phase_in_flight[phase],
+                    "capacity": limit,
+                    "saturated": self.phase_in_flight[phase] >= limit,
+                }
+                for phase, limit in self.phase_limits.items()
+            },
+            "routes": {
+                path: {"in_flight": self.route_in_flight[path], "capacity": limit}
+                for path, limit in self.route_limits.items()
+            },
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+        ASGI middleware that sheds requests the controller cannot admit.
+
+        Args:
+            app: The wrapped ASGI application.
+            controller: Shared in-flight accounting.
+        """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"].rstrip("/") or "/"
+        retry_attempt = Headers(scope=scope).get(RETRY_HEADER, "0")
+        retried = retry_attempt.isdigit() and int(retry_attempt) > 0
+
+        if not self.controller.try_admit(path, retried):
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Service is at capacity, retry later"},
+                headers={"Retry-After": str(self.controller.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(path)
+
+
+admission = AdmissionController(
+    max_inflight=settings.MAX_INFLIGHT_REQUESTS,
+    route_limits=settings.ROUTE_INFLIGHT_LIMITS,
+    retry_headroom=settings.RETRY_INFLIGHT_HEADROOM,
+    retry_after=settings.SHED_RETRY_AFTER_SECONDS,
+    phase_limits={PHASE1: settings.PHASE1_MAX_INFLIGHT, PHASE2: settings.PHASE2_MAX_INFLIGHT},
+    phase_routes=PHASE_ROUTES,
+)
@@ -0,0 +1,214 @@
+#File: app/binary.py
+"""
+MessagePack and CBOR request/response support.
+
+Routers built with ``route_class=BinaryBodyRoute`` accept
+``application/msgpack`` and ``application/cbor`` bodies in addition to JSON.
+The binary body is decoded once into plain Python objects and handed to
+FastAPI as the already-parsed request body, so it validates straight into the
+existing Pydantic models. Validation failures therefore reach
+``validation_exception_handler`` exactly as JSON ones do.
+
+Callers that send a matching ``Accept`` header get successful responses
+encoded the same way; errors are always JSON.
+
+``msgpack`` and ``cbor2`` are pinned in requirements.txt. If one is missing
+from an installation anyway, its media types are answered with
+415 Unsupported Media Type rather than being parsed as JSON. Streaming batch
+endpoints use :func:`iter_binary_items` to decode a stream of concatenated
+MessagePack objects or a CBOR sequence incrementally.
+"""
+
+import io
+import json
+from typing import AsyncIterator, Callable
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers
+
+try:  # pragma: no cover - pinned, but tolerated when missing
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:  # pragma: no cover - pinned, but tolerated when missing
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+
+class Codec:
+    """A binary serialization format usable for request and response bodies."""
+
+    def __init__(self, name: str, media_type: str, loads: Callable[[bytes], object], dumps: Callable[[object], bytes]):
+        self.name = name
+        self.media_type = media_type
+        self.loads = loads
+        self.dumps = dumps
+
+
+def _available_codecs() -> dict[str, Codec]:
+    """Map each accepted media type to its codec."""
+    codecs: dict[str, Codec] = {}
+    if msgpack is not None:
+        codec = Codec("msgpack", "application/msgpack",
+                      lambda data: msgpack.unpackb(data, raw=False), msgpack.packb)
+        codecs["application/msgpack"] = codec
+        codecs["application/x-msgpack"] = codec
+    if cbor2 is not None:
+        codec = Codec("cbor", "application/cbor", cbor2.loads, cbor2.dumps)
+        codecs["application/cbor"] = codec
+        codecs["application/cbor-seq"] = codec
+    return codecs
+
+
+CODECS = _available_codecs()
+
+# Every binary media type this module understands, installed or not.
+BINARY_MEDIA_TYPES = frozenset({
+    "application/msgpack", "application/x-msgpack", "application/cbor", "application/cbor-seq",
+})
+
+
+def media_type(content_type: str | None) -> str:
+    """Return the bare, lower-cased media type of a Content-Type header."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def codec_for(content_type: str | None) -> Codec | None:
+    """Return the codec for a Content-Type header, or None for JSON/unknown types."""
+    return CODECS.get(media_type(content_type))
+
+
+def require_codec(content_type: str | None) -> Codec | None:
+    """
+        Like :func:`codec_for`, but refuse binary types whose library is missing.
+
+        Raises:
+            HTTPException (415): For a known binary media type that cannot be
+                decoded in this installation.
+        """
+    codec = codec_for(content_type)
+    if codec is None and media_type(content_type) in BINARY_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported Content-Type: {media_type(content_type)} (codec not installed)",
+        )
+    return codec
+
+
+def negotiate_response_codec(accept: str | None) -> Codec | None:
+    """Return a binary codec when ``Accept`` explicitly asks for one."""
+    for item in (accept or "").split(","):
+        codec = CODECS.get(media_type(item))
+        if codec is not None:
+            return codec
+    return None
+
+
+class BinaryBodyRoute(APIRoute):
+    """
+        APIRoute that decodes MessagePack/CBOR bodies before validation.
+
+        Routes without a body model (for example streaming endpoints that read
+        the raw request) are left untouched.
+
+        Note:
+            This relies on FastAPI internals as of fastapi 0.115.x /
+            starlette 0.45.x: ``get_request_handler`` reuses ``request._json``
+            when it is already set and only parses bodies whose Content-Type
+            is JSON, and ``Request.headers`` is cached in ``request._headers``.
+            Re-check both when upgrading FastAPI.
+        """
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+        if self.body_field is None:
+            return original_handler
+
+        async def binary_route_handler(request: Request) -> Response:
+            codec = require_codec(request.headers.get("content-type"))
+            if codec is not None:
+                body = await request.body()
+                try:
+                    request._json = codec.loads(body) if body else None
+                except Exception as exc:
+                    raise RequestValidationError([{
+                        "type": f"{codec.name}_invalid",
+                        "loc": ("body",),
+                        "msg": f"{codec.name.upper()} decode error",
+                        "input": {},
+                        "ctx": {"error": str(exc)},
+                    }])
+                # Present the decoded body to FastAPI as already-parsed JSON
+                # (see the class docstring for the internals this relies on).
+                request.scope["headers"] = [
+                    (key, b"application/json" if key == b"content-type" else value)
+                    for key, value in request.scope["headers"]
+                ]
+                request._headers = Headers(scope=request.scope)
+
+            response = await original_handler(request)
+
+            response_codec = negotiate_response_codec(request.headers.get("accept"))
+            if response_codec is not None and isinstance(response, JSONResponse):
+                headers = {
+                    key: value for key, value in response.headers.items()
+                    if key not in ("content-length", "content-type")
+                }
+                return Response(
+                    content=response_codec.dumps(json.loads(response.body)),
+                    status_code=response.status_code,
+                    headers=headers,
+                    media_type=response_codec.media_type,
+                    background=response.background,
+                )
+            return response
+
+        return binary_route_handler
+
+
+async def iter_binary_items(chunks: AsyncIterator[bytes], codec: Codec,
+                            max_item_bytes: int) -> AsyncIterator[tuple[int, object]]:
+    """
+        Incrementally decode a stream of MessagePack objects or a CBOR sequence.
+
+        Yields:
+            ``(index, item)`` for each decoded top-level object.
+
+        Raises:
+            ValueError: If a single item exceeds ``max_item_bytes`` or the
+                stream is malformed.
+        """
+    index = 0
+    if codec.name == "msgpack":
+        unpacker = msgpack.Unpacker(raw=False, max_buffer_size=max_item_bytes)
+        async for chunk in chunks:
+            try:
+                unpacker.feed(chunk)
+            except msgpack.BufferFull:
+                raise ValueError(f"Item {index} exceeds {max_item_bytes} bytes")
+            for item in unpacker:
+                yield index, item
+                index += 1
+        return
+
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while buffer:
+            stream = io.BytesIO(buffer)
+            try:
+                item = cbor2.CBORDecoder(stream).decode()
+            except cbor2.CBORDecodeEOF:
+                break
+            del buffer[:stream.tell()]
+            yield index, item
+            index += 1
+        if len(buffer) > max_item_bytes:
+            raise ValueError(f"Item {index} exceeds {max_item_bytes} bytes")
+    if buffer:
+        raise ValueError(f"Item {index} is truncated")
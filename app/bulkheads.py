@@ -0,0 +1,160 @@
+#File: app/bulkheads.py
+"""
+Bulkhead isolation between Phase 1 and Phase 2 traffic.
+
+Application submission (Phase 1) is cheap, and document analysis (Phase 2)
+is slow and heavy. Each phase gets its own bulkhead so a surge in one cannot
+take capacity from the other:
+
+* its own tenant scheduler (``app.scheduling.schedulers``): requests wait
+  for a slot on the event loop in weighted fair order, without holding a
+  thread, so a noisy tenant's backlog cannot push other tenants behind it;
+* its own worker threads: granted calls run on a dedicated anyio
+  ``CapacityLimiter`` sized to the scheduler instead of the shared default
+  threadpool;
+* its own bounded wait queue: at most ``max_queue`` requests wait for a
+  slot. Once it is full, new requests are rejected immediately (batch
+  streams instead wait for a place to free up); tenant fairness decides
+  the order inside the queue, not who gets into it;
+* its own upstream connection pool (``app.client.http_pool``), sized from
+  the same setting.
+
+Counters are only touched on the event loop thread.
+"""
+
+import asyncio
+from collections import deque
+from typing import Callable, TypeVar
+
+import anyio
+
+from app.config import settings
+from app.scheduling import DEFAULT_TENANT, PHASE1, PHASE2, TenantScheduler, schedulers
+
+T = TypeVar("T")
+
+
+class BulkheadFull(RuntimeError):
+    """Raised when a bulkhead's wait queue is full."""
+
+
+class _QueueFull(Exception):
+    """Internal: the scheduler refused to queue a request."""
+
+
+class Bulkhead:
+    """
+        Per-phase scheduler, worker threads and bounded wait queue.
+
+        Args:
+            name: Phase name, used in metrics and errors.
+            scheduler: The phase's tenant scheduler; its ``max_concurrency``
+                sizes the worker threads.
+            max_queue: Hard limit on requests waiting for a slot.
+        """
+
+    def __init__(self, name: str, scheduler: TenantScheduler, max_queue: int):
+        self.name = name
+        self.scheduler = scheduler
+        self.max_concurrency = scheduler.max_concurrency
+        self.max_queue = max_queue
+        # The scheduler bounds concurrency, so this never makes a caller wait;
+        # it only keeps the phase's calls off the shared default threadpool.
+        self._threads = anyio.CapacityLimiter(scheduler.max_concurrency)
+        # ``wait=True`` callers held back while the queue is full, oldest first.
+        self._room_waiters: deque[asyncio.Future] = deque()
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.completed = 0
+
+    async def run(self, func: Callable[..., T], *args, tenant: str = DEFAULT_TENANT, wait: bool = False) -> T:
+        """
+            Run blocking ``func(*args)`` once ``tenant`` is granted a slot.
+
+            Args:
+                func: Blocking call, run on this bulkhead's worker threads.
+                tenant: Scheduling tenant of the request.
+                wait: When the queue is full, wait for a place in it instead
+                    of failing. Batch streams use this: they already bound
+                    their own concurrency and have no way to retry an item.
+
+            Raises:
+                BulkheadFull: If no slot is free, the queue is full and
+                    ``wait`` is False.
+            """
+        while True:
+            queued = False
+
+            def enter_queue() -> None:
+                nonlocal queued
+                if self.waiting >= self.max_queue:
+                    raise _QueueFull
+                self.waiting += 1
+                queued = True
+
+            try:
+                async with self.scheduler.async_slot(tenant, on_queue=enter_queue):
+                    if queued:
+                        queued = False
+                        self._leave_queue()
+                    self.active += 1
+                    try:
+                        return await anyio.to_thread.run_sync(func, *args, limiter=self._threads)
+                    finally:
+                        self.active -= 1
+                        self.completed += 1
+                        # A freed slot lets a held-back caller in even when
+                        # nothing was queued (e.g. max_queue=0).
+                        self._wake_room_waiter()
+            except _QueueFull:
+                if not wait:
+                    self.rejected += 1
+                    raise BulkheadFull(f"{self.name} bulkhead is saturated") from None
+            finally:
+                if queued:
+                    self._leave_queue()
+            await self._wait_for_room()
+
+    def _leave_queue(self) -> None:
+        self.waiting -= 1
+        self._wake_room_waiter()
+
+    def _wake_room_waiter(self) -> None:
+        while self._room_waiters:
+            waiter = self._room_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait_for_room(self) -> None:
+        """Wait until the queue may have a free place."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._room_waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # Woken but cancelled before it could use the place: pass it on.
+                self._wake_room_waiter()
+            elif waiter in self._room_waiters:
+                self._room_waiters.remove(waiter)
+            raise
+
+    def snapshot(self) -> dict:
+        """Return current utilization of this bulkhead."""
+        return {
+            "in_use": self.active,
+            "capacity": self.max_concurrency,
+            "utilization": round(self.active / self.max_concurrency, 3) if self.max_concurrency else 1.0,
+            "waiting": self.waiting,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+            "completed": self.completed,
+        }
+
+
+bulkheads = {
+    PHASE1: Bulkhead(PHASE1, schedulers[PHASE1], settings.PHASE1_MAX_QUEUE),
+    PHASE2: Bulkhead(PHASE2, schedulers[PHASE2], settings.PHASE2_MAX_QUEUE),
+}
@@ -7,9 +7,63 @@ Handles authentication, request formatting, and response parsing for
 both Phase 1 (application submission) and Phase 2 (technical analysis) endpoints.
 """
 
+import threading
+
 import httpx
+from pydantic import BaseModel
+from app.bulkheads import PHASE1, PHASE2
+from app.compression import compress_payload
 from app.config import settings
+from app.ledger import APPLICATION, TECHNICAL_ANALYSIS, ledger
 from app.models import ApplicationRequest, TechnicalAnalysisRequest
+from app.scheduling import schedulers, tenant_label
+
+_POOL_SIZES = {
+    PHASE1: settings.PHASE1_MAX_CONCURRENCY,
+    PHASE2: settings.PHASE2_MAX_CONCURRENCY,
+}
+_pools: dict[str, httpx.Client] = {}
+_pool_lock = threading.Lock()
+
+
+def http_pool(phase: str) -> httpx.Client:
+    """
+        Return the pooled HTTP client for a phase, creating it on first use.
+
+        Sharing one client per phase keeps upstream connections alive across
+        requests instead of paying a TCP/TLS handshake per call, while keeping
+        Phase 1 and Phase 2 from competing for the same connections.
+        """
+    pool = _pools.get(phase)
+    if pool is None or pool.is_closed:
+        with _pool_lock:
+            pool = _pools.get(phase)
+            if pool is None or pool.is_closed:
+                pool = httpx.Client(
+                    timeout=10.0,
+                    limits=httpx.Limits(max_connections=_POOL_SIZES[phase]),
+                )
+                _pools[phase] = pool
+    return pool
+
+
+def pool_status() -> dict:
+    """Report each phase pool's size and whether it is currently open."""
+    return {
+        phase: {
+            "created": phase in _pools,
+            "open": phase not in _pools or not _pools[phase].is_closed,
+            "max_connections": size,
+        }
+        for phase, size in _POOL_SIZES.items()
+    }
+
+
+def close_pool() -> None:
+    """Close every phase pool; the next call recreates it."""
+    for pool in list(_pools.values()):
+        pool.close()
+
 
 class WGAIClient:
     """
@@ -48,20 +102,46 @@ class WGAIClient:
 
         self.base_url = settings.WGAI_BASE_URL
 
-    def _headers(self, api_key: str) -> dict:
+    def _headers(self, api_key: str, content_encoding: str | None = None) -> dict:
         """
                 Build request headers with authentication.
 
                 Args:
                     api_key: WGAI API key for the target endpoint phase.
+                    content_encoding: Optional encoding applied to the request body.
 
                 Returns:
                     Dictionary containing auth and content-type headers.
                 """
-        return {
+        headers = {
         "X-Auth-Key": api_key,
         "Content-Type": "application/json",
         }
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        return headers
+
+    def _encode(self, payload: BaseModel) -> tuple[bytes, str | None]:
+        """
+                Serialize a payload, gzipping it when outbound compression is enabled.
+
+                Args:
+                    payload: Validated request model.
+
+                Returns:
+                    Tuple of (body bytes, content encoding or None).
+                """
+        body = payload.model_dump_json().encode("utf-8")
+        if not settings.WGAI_COMPRESS_REQUESTS:
+            return body, None
+        return compress_payload(body, settings.WGAI_COMPRESS_MIN_BYTES)
+
+    @staticmethod
+    def _upstream_id(result) -> str | None:
+        """Extract WGAI's submission id from a response body, if present."""
+        if isinstance(result, dict) and result.get("id") is not None:
+            return str(result["id"])
+        return None
 
     def submit_application(self, payload: ApplicationRequest, api_key: str | None = None) -> dict:
         """
@@ -70,11 +150,13 @@ class WGAIClient:
                 Args:
                     payload: Validated application data (personal info, skills, etc.).
                     api_key: Optional API key override. Defaults to API_KEY_PHASE1
-                             from environment. Useful for testing or multi-tenant scenarios.
+                             from environment. Useful for testing or multi-tenant scenarios;
+                             each distinct key is scheduled as its own tenant.
 
                 Returns:
                     Parsed JSON response from WGAI containing submission
-                    confirmation and processing status.
+                    confirmation and processing status. Successful submissions
+                    are recorded in the local submission ledger.
 
                 Raises:
                     httpx.TimeoutException: If request exceeds timeout threshold.
@@ -84,15 +166,23 @@ class WGAIClient:
         key = api_key if api_key is not None else settings.API_KEY_PHASE1
 
         url =f"{self.base_url}/v1/api/hire/me"
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
+        body, encoding = self._encode(payload)
+        with schedulers[PHASE1].slot(tenant_label(api_key)):
+            response = http_pool(PHASE1).post(
                 url,
-                headers=self._headers(key),
-                json=payload.model_dump(),
+                headers=self._headers(key, encoding),
+                content=body,
             )
 
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        ledger.record(
+            APPLICATION,
+            email=payload.email,
+            github_url=payload.github_url,
+            upstream_id=self._upstream_id(result),
+        )
+        return result
 
     def analyze_technical_document(self, payload: TechnicalAnalysisRequest, api_key: str | None = None) -> dict:
         """
@@ -116,17 +206,28 @@ class WGAIClient:
                 Note:
                     Phase 2 uses a different API key than Phase 1, reflecting
                     WGAI's tiered access control model.
+
+                    Like submit_application, the call waits for a slot from the
+                    per-tenant scheduler before it is sent, but both the
+                    scheduler and the connection pool are Phase 2's own.
                 """
         key = api_key if api_key is not None else settings.API_KEY_PHASE2
 
         url = f"{self.base_url}/v2/api/analyze/technical-document"
+        body, encoding = self._encode(payload)
 
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
+        with schedulers[PHASE2].slot(tenant_label(api_key)):
+            response = http_pool(PHASE2).post(
                 url,
-                headers=self._headers(key),
-                json=payload.model_dump(),
+                headers=self._headers(key, encoding),
+                content=body,
             )
 
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        result = response.json()
+        ledger.record(
+            TECHNICAL_ANALYSIS,
+            submitted_by=payload.submitted_by,
+            upstream_id=self._upstream_id(result),
+        )
+        return result
@@ -0,0 +1,222 @@
+#File: app/compression.py
+"""
+HTTP body compression support.
+
+Provides an ASGI middleware that transparently decodes compressed request
+bodies (``Content-Encoding: gzip``, ``deflate``, ``br`` and ``zstd``) and a
+helper for compressing outbound payloads sent to WGAI. Decompression is
+streamed chunk by chunk and capped, so a small compressed body can never
+expand into an unbounded allocation.
+
+Brotli and Zstandard are optional: they are only advertised when the
+``brotli`` (1.1 or later, for bounded output) / ``zstandard`` packages are
+installed.
+"""
+
+import gzip
+import zlib
+from typing import Callable, Iterator
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # pragma: no cover - optional dependency
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Upper bound for a single decompressed chunk handed to the application.
+DECODE_CHUNK_SIZE = 64 * 1024
+
+# zstandard's decompressobj has no output limit, so input is fed in slices
+# this small. A zstd block decodes to at most 128 KiB and costs at least
+# 4 input bytes, so one slice can never expand past 2 MiB.
+ZSTD_INPUT_SLICE = 64
+
+
+def _brotli_output_is_bounded() -> bool:
+    """brotli < 1.1 cannot limit ``process()`` output; such versions stay unsupported."""
+    try:
+        brotli.Decompressor().process(b"", output_buffer_limit=1)
+    except TypeError:
+        return False
+    return True
+
+
+class _ZlibDecoder:
+    """Incremental gzip/deflate decoder that never emits more than one chunk at a time."""
+
+    def __init__(self, wbits: int):
+        self._decompressor = zlib.decompressobj(wbits)
+
+    def decode(self, data: bytes, final: bool) -> Iterator[bytes]:
+        while data:
+            chunk = self._decompressor.decompress(data, DECODE_CHUNK_SIZE)
+            if chunk:
+                yield chunk
+            data = self._decompressor.unconsumed_tail
+        if final:
+            tail = self._decompressor.flush()
+            if tail:
+                yield tail
+
+
+class _BrotliDecoder:
+    """Incremental Brotli decoder (requires the ``brotli`` package)."""
+
+    def __init__(self):
+        self._decompressor = brotli.Decompressor()
+
+    def decode(self, data: bytes, final: bool) -> Iterator[bytes]:
+        if not data:
+            return
+        chunk = self._decompressor.process(data, output_buffer_limit=DECODE_CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = self._decompressor.process(b"", output_buffer_limit=DECODE_CHUNK_SIZE)
+
+
+class _ZstdDecoder:
+    """Incremental Zstandard decoder (requires the ``zstandard`` package)."""
+
+    def __init__(self):
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decode(self, data: bytes, final: bool) -> Iterator[bytes]:
+        view = memoryview(data)
+        for offset in range(0, len(view), ZSTD_INPUT_SLICE):
+            chunk = self._decompressor.decompress(view[offset:offset + ZSTD_INPUT_SLICE])
+            for start in range(0, len(chunk), DECODE_CHUNK_SIZE):
+                yield chunk[start:start + DECODE_CHUNK_SIZE]
+
+
+def _available_decoders() -> dict[str, Callable[[], object]]:
+    """Map each supported ``Content-Encoding`` token to a decoder factory."""
+    decoders: dict[str, Callable[[], object]] = {
+        "gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+        "x-gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+        "deflate": lambda: _ZlibDecoder(zlib.MAX_WBITS),
+    }
+    if brotli is not None and _brotli_output_is_bounded():
+        decoders["br"] = _BrotliDecoder
+    if zstandard is not None:
+        decoders["zstd"] = _ZstdDecoder
+    return decoders
+
+
+DECODERS = _available_decoders()
+
+
+class RequestDecompressionMiddleware:
+    """
+        ASGI middleware that decodes compressed request bodies on the fly.
+
+        The ``Content-Encoding`` and ``Content-Length`` headers are removed
+        from the scope once a decoder is attached, so downstream handlers see
+        a plain identity body.
+
+        Args:
+            app: The wrapped ASGI application.
+            max_decompressed_bytes: Maximum decoded body size for routes
+                without an entry in ``route_limits``. Exceeding it aborts the
+                request with 413 Payload Too Large.
+            route_limits: Mapping of request path to decoded byte limit, so
+                routes that accept large bodies (the batch streams) can take
+                them compressed too.
+        """
+
+    def __init__(self, app: ASGIApp, max_decompressed_bytes: int, route_limits: dict[str, int] | None = None):
+        self.app = app
+        self.max_decompressed_bytes = max_decompressed_bytes
+        self.route_limits = route_limits or {}
+
+    def limit_for(self, path: str) -> int:
+        """Return the decoded byte limit that applies to ``path``."""
+        return self.route_limits.get(path.rstrip("/") or "/", self.max_decompressed_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = Headers(scope=scope).get("content-encoding", "").strip().lower()
+        if encoding in ("", "identity"):
+            await self.app(scope, receive, send)
+            return
+
+        factory = DECODERS.get(encoding)
+        if factory is None:
+            response = JSONResponse(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                content={"detail": f"Unsupported Content-Encoding: {encoding}"},
+            )
+            await response(scope, receive, send)
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (key, value) for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length")
+        ]
+        limit = self.limit_for(scope["path"])
+        await self.app(scope, self._decoding_receive(receive, factory(), limit), send)
+
+    def _decoding_receive(self, receive: Receive, decoder, limit: int) -> Receive:
+        """Wrap ``receive`` so each body message is decoded lazily, one chunk at a time."""
+        state = {"pieces": iter(()), "final": False, "total": 0}
+
+        async def receive_decoded() -> Message:
+            while True:
+                try:
+                    chunk = next(state["pieces"])
+                except StopIteration:
+                    chunk = None
+                except Exception as exc:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Malformed compressed request body: {exc}",
+                    )
+
+                if chunk is not None:
+                    state["total"] += len(chunk)
+                    if state["total"] > limit:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"Decompressed request body exceeds {limit} bytes",
+                        )
+                    return {"type": "http.request", "body": chunk, "more_body": True}
+
+                if state["final"]:
+                    return {"type": "http.request", "body": b"", "more_body": False}
+
+                message = await receive()
+                if message["type"] != "http.request":
+                    return message
+                state["final"] = not message.get("more_body", False)
+                state["pieces"] = decoder.decode(message.get("body", b""), state["final"])
+
+        return receive_decoded
+
+
+def compress_payload(body: bytes, min_bytes: int) -> tuple[bytes, str | None]:
+    """
+        Gzip an outbound payload when it is large enough to be worth it.
+
+        Args:
+            body: Serialized request body.
+            min_bytes: Bodies smaller than this are sent uncompressed.
+
+        Returns:
+            Tuple of (body, content_encoding); ``content_encoding`` is None
+            when the body was left as-is.
+        """
+    if len(body) < min_bytes:
+        return body, None
+    return gzip.compress(body, compresslevel=6), "gzip"
@@ -9,11 +9,112 @@ import os
 
 load_dotenv()
 
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to ``default``."""
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_int_map(name: str, default: dict[str, int]) -> dict[str, int]:
+    """Read a ``key=int,key=int`` mapping, merged over ``default``."""
+    limits = dict(default)
+    for item in (os.getenv(name) or "").split(","):
+        if "=" in item:
+            path, value = item.split("=", 1)
+            limits[path.strip()] = int(value)
+    return limits
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to ``default``."""
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable (1/true/yes/on are truthy)."""
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 class Settings:
     """Application configuration settings loaded from environment variables."""
     WGAI_BASE_URL = os.getenv("WGAI_SERVER_URL")
     API_KEY_PHASE1 = os.getenv("WGAI_API_KEY_PHASE1")
     API_KEY_PHASE2 = os.getenv("WGAI_API_KEY_PHASE2")
 
+    # Compression (routes listed in ROUTE_BODY_LIMITS use that limit instead)
+    REQUEST_MAX_DECOMPRESSED_BYTES = _env_int("REQUEST_MAX_DECOMPRESSED_BYTES", 10_485_760)  # 10 MB
+    RESPONSE_COMPRESSION_MIN_BYTES = _env_int("RESPONSE_COMPRESSION_MIN_BYTES", 1024)
+    WGAI_COMPRESS_REQUESTS = _env_bool("WGAI_COMPRESS_REQUESTS", False)
+    WGAI_COMPRESS_MIN_BYTES = _env_int("WGAI_COMPRESS_MIN_BYTES", 1024)
+
+    # Payload size limits
+    MAX_BODY_BYTES = _env_int("MAX_BODY_BYTES", 1_048_576)  # 1 MB
+    ROUTE_BODY_LIMITS = _env_int_map("ROUTE_BODY_LIMITS", {
+        "/submit/application": 65_536,
+        "/analyze/tech-documents": 1_048_576,
+        "/submit/applications/stream": 268_435_456,
+        "/analyze/tech-documents/stream": 268_435_456,
+    })
+    MAX_LIST_ITEMS = _env_int("MAX_LIST_ITEMS", 100)
+    MAX_TEXT_CHARS = _env_int("MAX_TEXT_CHARS", 200_000)
+
+    # Near-duplicate document detection (policy: off, flag, reuse or reject)
+    DEDUP_POLICY = os.getenv("DEDUP_POLICY", "flag").lower()
+    DEDUP_MAX_DISTANCE = _env_int("DEDUP_MAX_DISTANCE", 3)
+    DEDUP_MAX_ENTRIES = _env_int("DEDUP_MAX_ENTRIES", 100_000)
+    DEDUP_MAX_RESULT_BYTES = _env_int("DEDUP_MAX_RESULT_BYTES", 67_108_864)  # 64 MB, compressed
+    DEDUP_SNAPSHOT_PATH = os.getenv("DEDUP_SNAPSHOT_PATH")
+
+    # Phase bulkheads: worker threads, upstream connections and tenant
+    # scheduler slots per phase, plus how many requests may wait for one
+    PHASE1_MAX_CONCURRENCY = _env_int("PHASE1_MAX_CONCURRENCY", 16)
+    PHASE1_MAX_QUEUE = _env_int("PHASE1_MAX_QUEUE", 64)
+    PHASE2_MAX_CONCURRENCY = _env_int("PHASE2_MAX_CONCURRENCY", 8)
+    PHASE2_MAX_QUEUE = _env_int("PHASE2_MAX_QUEUE", 32)
+
+    # Per-tenant upstream scheduling (TENANT_WEIGHTS is a label=weight list);
+    # TENANT_MAX_CONCURRENCY 0 means each phase's own PHASE*_MAX_CONCURRENCY
+    TENANT_MAX_CONCURRENCY = _env_int("TENANT_MAX_CONCURRENCY", 0)
+    TENANT_WEIGHTS = _env_int_map("TENANT_WEIGHTS", {"default": 4})
+
+    # Admission control / load shedding (ROUTE_INFLIGHT_LIMITS is a path=count list).
+    # Each phase's routes are admitted from their own budget, not from
+    # MAX_INFLIGHT_REQUESTS, so a surge in one phase cannot shed the other.
+    MAX_INFLIGHT_REQUESTS = _env_int("MAX_INFLIGHT_REQUESTS", 64)
+    PHASE1_MAX_INFLIGHT = _env_int("PHASE1_MAX_INFLIGHT", PHASE1_MAX_CONCURRENCY + PHASE1_MAX_QUEUE)
+    PHASE2_MAX_INFLIGHT = _env_int("PHASE2_MAX_INFLIGHT", PHASE2_MAX_CONCURRENCY + PHASE2_MAX_QUEUE)
+    ROUTE_INFLIGHT_LIMITS = _env_int_map("ROUTE_INFLIGHT_LIMITS", {})
+    RETRY_INFLIGHT_HEADROOM = _env_int("RETRY_INFLIGHT_HEADROOM", 8)
+    SHED_RETRY_AFTER_SECONDS = _env_int("SHED_RETRY_AFTER_SECONDS", 1)
+
+    # Streaming batch endpoints
+    BATCH_CONCURRENCY = _env_int("BATCH_CONCURRENCY", 4)
+    BATCH_MAX_LINE_BYTES = _env_int("BATCH_MAX_LINE_BYTES", 1_048_576)
+    BATCH_PROGRESS_INTERVAL_SECONDS = _env_float("BATCH_PROGRESS_INTERVAL_SECONDS", 2.0)
+
+    # Local submission ledger
+    LEDGER_PATH = os.getenv("LEDGER_PATH", "data/submissions.db")
+    # GET /submissions exposes applicant PII; disabled unless LEDGER_TOKEN is set
+    LEDGER_TOKEN = os.getenv("LEDGER_TOKEN")
+
+    # Email deliverability (MX) checks
+    EMAIL_DELIVERABILITY_CHECK = _env_bool("EMAIL_DELIVERABILITY_CHECK", False)
+    EMAIL_DNS_TIMEOUT_SECONDS = _env_float("EMAIL_DNS_TIMEOUT_SECONDS", 1.0)
+    EMAIL_DNS_TTL_SECONDS = _env_float("EMAIL_DNS_TTL_SECONDS", 3600)
+    EMAIL_DNS_NEGATIVE_TTL_SECONDS = _env_float("EMAIL_DNS_NEGATIVE_TTL_SECONDS", 300)
+
+    # Debug profiling endpoints (disabled unless DEBUG_TOKEN is set)
+    DEBUG_TOKEN = os.getenv("DEBUG_TOKEN")
+    PROFILE_MAX_SECONDS = _env_int("PROFILE_MAX_SECONDS", 60)
+
+    # Readiness probe
+    READINESS_INTERVAL_SECONDS = _env_float("READINESS_INTERVAL_SECONDS", 10.0)
+    READINESS_TIMEOUT_SECONDS = _env_float("READINESS_TIMEOUT_SECONDS", 2.0)
+
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
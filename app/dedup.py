@@ -0,0 +1,219 @@
+#File: app/dedup.py
+"""
+Near-duplicate detection for technical documents.
+
+Each ``TechnicalAnalysisRequest`` is reduced to a 64-bit SimHash fingerprint
+over the word shingles of its ``synopsis`` and ``analysis``. Lightly edited
+re-submissions land within a few bits (Hamming distance) of the original.
+
+Fingerprints are kept in a banded index: the 64 bits are split into
+``max_distance + 1`` bands, so by the pigeonhole principle any fingerprint
+within ``max_distance`` bits of a stored one matches it exactly in at least
+one band. A lookup is therefore a handful of dict probes plus a popcount per
+candidate, independent of how many documents are stored.
+
+Upstream results kept for the "reuse" policy are stored zlib-compressed
+under a separate byte budget. When the budget is exceeded, the least recently
+used results are dropped first; their fingerprints stay indexed, so those
+documents are still flagged or rejected but are analyzed again under "reuse".
+
+Every entry belongs to a tenant (see ``app.scheduling.tenant_label``) and
+only matches lookups from that tenant. A caller never gets another tenant's
+stored analysis back, and never learns that another tenant submitted a
+similar document.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.config import settings
+from app.models import TechnicalAnalysisRequest
+from app.scheduling import DEFAULT_TENANT
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """
+        Compute a 64-bit SimHash fingerprint of ``text``.
+
+        Args:
+            text: Free text to fingerprint.
+            shingle_size: Number of consecutive words per feature.
+
+        Returns:
+            Fingerprint as a non-negative integer.
+        """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) > shingle_size:
+        features = [" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)]
+    else:
+        features = [" ".join(words)]
+
+    # Render each feature hash as a bit string and count ones per column;
+    # zip() does the column walk in C, which keeps long documents cheap.
+    rows = [
+        format(int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "big"), "064b")
+        for f in features
+    ]
+    threshold = len(rows) / 2
+    fingerprint = 0
+    for column in zip(*rows):
+        fingerprint = (fingerprint << 1) | (column.count("1") > threshold)
+    return fingerprint
+
+
+def document_fingerprint(payload: TechnicalAnalysisRequest) -> int:
+    """Fingerprint the free-text fields of a technical analysis request."""
+    return simhash(f"{payload.synopsis}\n{payload.analysis}")
+
+
+@dataclass
+class NearDuplicate:
+    """A stored document matching a lookup."""
+    entry_id: int
+    distance: int
+    result: dict | None
+
+
+class NearDuplicateIndex:
+    """
+        Bounded, thread-safe SimHash index with LRU eviction, partitioned by
+        tenant.
+
+        Args:
+            max_entries: Maximum number of fingerprints retained; the least
+                recently matched or inserted entry is evicted first.
+            max_distance: Maximum Hamming distance (in bits) for two
+                fingerprints to count as near-duplicates.
+            max_result_bytes: Budget for stored (compressed) upstream results.
+        """
+
+    def __init__(self, max_entries: int, max_distance: int = 3, max_result_bytes: int = 64 * 1024 * 1024):
+        if not 0 <= max_distance < FINGERPRINT_BITS:
+            raise ValueError("max_distance must be between 0 and 63")
+
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self.max_result_bytes = max_result_bytes
+        bands = max_distance + 1
+        edges = [round(i * FINGERPRINT_BITS / bands) for i in range(bands + 1)]
+        self._bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])]
+        self._buckets: list[dict[tuple[str, int], set[int]]] = [{} for _ in self._bands]
+        self._entries: OrderedDict[int, tuple[str, int]] = OrderedDict()
+        self._results: OrderedDict[int, bytes] = OrderedDict()
+        self._result_bytes = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def result_bytes(self) -> int:
+        """Compressed size of all stored upstream results."""
+        return self._result_bytes
+
+    def _band_keys(self, tenant: str, fingerprint: int):
+        return [(tenant, (fingerprint >> shift) & mask) for shift, mask in self._bands]
+
+    def find(self, fingerprint: int, tenant: str = DEFAULT_TENANT) -> NearDuplicate | None:
+        """Return the closest entry ``tenant`` stored within ``max_distance``, if any."""
+        with self._lock:
+            best: NearDuplicate | None = None
+            seen: set[int] = set()
+            for buckets, key in zip(self._buckets, self._band_keys(tenant, fingerprint)):
+                for entry_id in buckets.get(key, ()):
+                    if entry_id in seen:
+                        continue
+                    seen.add(entry_id)
+                    distance = (self._entries[entry_id][1] ^ fingerprint).bit_count()
+                    if distance <= self.max_distance and (best is None or distance < best.distance):
+                        best = NearDuplicate(entry_id, distance, None)
+            if best is None:
+                return None
+            self._entries.move_to_end(best.entry_id)
+            blob = self._results.get(best.entry_id)
+            if blob is not None:
+                self._results.move_to_end(best.entry_id)
+        if blob is not None:
+            best.result = json.loads(zlib.decompress(blob))
+        return best
+
+    def add(self, fingerprint: int, result: dict | None = None, tenant: str = DEFAULT_TENANT) -> int:
+        """Store a fingerprint (and optionally its upstream result) for ``tenant``; returns its entry id."""
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (tenant, fingerprint)
+            for buckets, key in zip(self._buckets, self._band_keys(tenant, fingerprint)):
+                buckets.setdefault(key, set()).add(entry_id)
+            if result is not None:
+                blob = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"))
+                if len(blob) <= self.max_result_bytes:
+                    self._results[entry_id] = blob
+                    self._result_bytes += len(blob)
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+            while self._result_bytes > self.max_result_bytes:
+                self._drop_result(next(iter(self._results)))
+            return entry_id
+
+    def _drop_result(self, entry_id: int) -> None:
+        blob = self._results.pop(entry_id, None)
+        if blob is not None:
+            self._result_bytes -= len(blob)
+
+    def _evict_oldest(self) -> None:
+        entry_id, (tenant, fingerprint) = self._entries.popitem(last=False)
+        self._drop_result(entry_id)
+        for buckets, key in zip(self._buckets, self._band_keys(tenant, fingerprint)):
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del buckets[key]
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the index to ``path`` as JSON lines, oldest first."""
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with self._lock:
+            entries = [(tenant, fingerprint, self._results.get(entry_id))
+                       for entry_id, (tenant, fingerprint) in self._entries.items()]
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            for tenant, fingerprint, blob in entries:
+                result = json.loads(zlib.decompress(blob)) if blob is not None else None
+                fh.write(json.dumps({"tenant": tenant, "fingerprint": fingerprint, "result": result}) + "\n")
+        os.replace(tmp_path, path)
+
+    def load(self, path: str | Path) -> int:
+        """Load entries written by :meth:`save`; returns the number loaded."""
+        path = Path(path)
+        if not path.exists():
+            return 0
+        loaded = 0
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    record = json.loads(line)
+                    self.add(record["fingerprint"], record.get("result"), record.get("tenant", DEFAULT_TENANT))
+                    loaded += 1
+        return loaded
+
+
+near_duplicates = NearDuplicateIndex(
+    max_entries=settings.DEDUP_MAX_ENTRIES,
+    max_distance=settings.DEDUP_MAX_DISTANCE,
+    max_result_bytes=settings.DEDUP_MAX_RESULT_BYTES,
+)
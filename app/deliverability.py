@@ -0,0 +1,166 @@
+#File: app/deliverability.py
+"""
+Email deliverability checks.
+
+``EmailStr`` only validates syntax. When EMAIL_DELIVERABILITY_CHECK is
+enabled, the domains of ``ApplicationRequest.email`` and
+``TechnicalAnalysisRequest.submitted_by`` are also resolved for MX records
+(falling back to A and then AAAA records, the implicit MX of RFC 5321)
+before anything is sent to WGAI.
+
+Answers are cached per domain: positive results for EMAIL_DNS_TTL_SECONDS,
+negative ones for EMAIL_DNS_NEGATIVE_TTL_SECONDS. Concurrent lookups of the
+same domain share one query. Lookups are bounded by EMAIL_DNS_TIMEOUT_SECONDS,
+and timeouts or resolver failures fail open: the address is accepted and the
+result is not cached.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+import dns.asyncresolver
+import dns.resolver
+from fastapi.exceptions import RequestValidationError
+
+from app.config import settings
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class DeliverabilityChecker:
+    """
+        Cached, asynchronous MX-based domain deliverability check.
+
+        Args:
+            resolver: Object with an async ``resolve(name, rdtype, lifetime=...)``
+                method; defaults to a ``dns.asyncresolver.Resolver``.
+            timeout: Seconds allowed for a whole check (MX query plus the
+                A/AAAA fallback) before failing open.
+            ttl: Seconds a deliverable domain stays cached.
+            negative_ttl: Seconds an undeliverable domain stays cached.
+            max_entries: Maximum cached domains (least recently used evicted).
+        """
+
+    def __init__(self, resolver=None, timeout: float = 1.0, ttl: float = 3600,
+                 negative_ttl: float = 300, max_entries: int = 10_000):
+        self._resolver = resolver
+        self.timeout = timeout
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+
+    @property
+    def resolver(self):
+        if self._resolver is None:
+            self._resolver = dns.asyncresolver.Resolver()
+        return self._resolver
+
+    def _cached(self, domain: str) -> bool | None:
+        entry = self._cache.get(domain)
+        if entry is None:
+            return None
+        deliverable, expires = entry
+        if expires < time.monotonic():
+            del self._cache[domain]
+            return None
+        self._cache.move_to_end(domain)
+        return deliverable
+
+    def _store(self, domain: str, deliverable: bool) -> None:
+        ttl = self.ttl if deliverable else self.negative_ttl
+        self._cache[domain] = (deliverable, time.monotonic() + ttl)
+        self._cache.move_to_end(domain)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    async def _lookup(self, domain: str) -> bool | None:
+        """Resolve ``domain``; returns None when the answer is unknown."""
+        try:
+            answer = await self.resolver.resolve(domain, "MX", lifetime=self.timeout)
+            # A single "0 ." record is a null MX (RFC 7505): the domain refuses mail.
+            return not all(str(record.exchange) == "." for record in answer)
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.resolver.NoAnswer:
+            pass
+        except Exception as exc:
+            logger.warning("MX lookup for %s failed open: %s", domain, exc)
+            return None
+
+        # No MX: the domain's own address is the implicit MX, over IPv4 or IPv6.
+        for rdtype in ("A", "AAAA"):
+            try:
+                await self.resolver.resolve(domain, rdtype, lifetime=self.timeout)
+                return True
+            except dns.resolver.NXDOMAIN:
+                return False
+            except dns.resolver.NoAnswer:
+                continue
+            except Exception as exc:
+                logger.warning("%s lookup for %s failed open: %s", rdtype, domain, exc)
+                return None
+        return False
+
+    async def is_deliverable(self, domain: str) -> bool:
+        """Return False only when DNS positively shows ``domain`` cannot receive mail."""
+        domain = domain.lower().rstrip(".")
+        cached = self._cached(domain)
+        if cached is not None:
+            return cached
+
+        pending = self._pending.get(domain)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[domain] = future
+        try:
+            # One deadline for the MX query and its A/AAAA fallback together.
+            result = await asyncio.wait_for(self._lookup(domain), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Deliverability lookup for %s timed out; failing open", domain)
+            result = None
+        except BaseException:
+            # The leading request was cancelled; coalesced waiters fail open
+            # instead of inheriting its CancelledError.
+            future.set_result(True)
+            raise
+        finally:
+            del self._pending[domain]
+
+        if result is not None:
+            self._store(domain, result)
+        deliverable = result is not False
+        future.set_result(deliverable)
+        return deliverable
+
+    async def ensure_deliverable(self, email: str, field: str) -> None:
+        """
+            Raise a validation error when ``email``'s domain cannot receive mail.
+
+            Does nothing unless EMAIL_DELIVERABILITY_CHECK is enabled.
+
+            Raises:
+                RequestValidationError: Rendered as 400 by the app's
+                    validation_exception_handler, like any other field error.
+            """
+        if not settings.EMAIL_DELIVERABILITY_CHECK:
+            return
+        domain = email.rsplit("@", 1)[-1]
+        if not await self.is_deliverable(domain):
+            raise RequestValidationError([{
+                "loc": ("body", field),
+                "msg": f"The domain {domain} does not accept email",
+                "type": "email_undeliverable",
+            }])
+
+
+deliverability = DeliverabilityChecker(
+    timeout=settings.EMAIL_DNS_TIMEOUT_SECONDS,
+    ttl=settings.EMAIL_DNS_TTL_SECONDS,
+    negative_ttl=settings.EMAIL_DNS_NEGATIVE_TTL_SECONDS,
+)
@@ -0,0 +1,202 @@
+#File: app/ledger.py
+"""
+Local submission ledger.
+
+Records every successful upstream submission in an append-only SQLite table
+indexed by ``email``, ``github_url``, ``submitted_by`` and time. Questions
+like "did this candidate already apply?" can then be answered locally
+instead of with another WGAI call.
+
+Writes never touch the request path. ``record`` only enqueues a row, and a
+background writer thread batches rows into a single transaction. When the
+queue is full, rows are dropped and counted rather than blocking the caller.
+Reads open their own connection; WAL mode keeps them concurrent with the
+writer.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.config import settings
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _utc(value: datetime) -> datetime:
+    """Interpret naive datetimes as UTC rather than server local time."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    email TEXT,
+    github_url TEXT,
+    submitted_by TEXT,
+    upstream_id TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_submissions_created_at ON submissions (created_at);
+CREATE INDEX IF NOT EXISTS ix_submissions_email ON submissions (email, created_at);
+CREATE INDEX IF NOT EXISTS ix_submissions_github_url ON submissions (github_url, created_at);
+CREATE INDEX IF NOT EXISTS ix_submissions_submitted_by ON submissions (submitted_by, created_at);
+"""
+
+_COLUMNS = ("kind", "created_at", "email", "github_url", "submitted_by", "upstream_id")
+
+APPLICATION = "application"
+TECHNICAL_ANALYSIS = "technical_analysis"
+
+
+class SubmissionLedger:
+    """
+        Append-only, indexed record of successful submissions.
+
+        Args:
+            path: SQLite database file; parent directories are created.
+            queue_size: Maximum rows buffered before new rows are dropped.
+            batch_size: Maximum rows written per transaction.
+        """
+
+    def __init__(self, path: str | Path, queue_size: int = 10_000, batch_size: int = 500):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        if not self._initialized:
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return connection
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._start_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="submission-ledger", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        connection = self._connect()
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < self.batch_size:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in rows
+            records = [row for row in rows if row is not None]
+            try:
+                if records:
+                    with connection:
+                        connection.executemany(
+                            f"INSERT INTO submissions ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                            records,
+                        )
+            except sqlite3.Error:
+                logger.exception("Failed to write %d ledger rows", len(records))
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+            if stop:
+                connection.close()
+                return
+
+    def record(self, kind: str, email: str | None = None, github_url: str | None = None,
+               submitted_by: str | None = None, upstream_id: str | None = None) -> None:
+        """Enqueue one submission; never blocks the caller."""
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((kind, time.time(), email, github_url, submitted_by, upstream_id))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("Submission ledger queue full; dropped %s record", kind)
+
+    def flush(self) -> None:
+        """Block until every queued row has been written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write pending rows and stop the writer thread."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def query(self, email: str | None = None, github_url: str | None = None,
+              submitted_by: str | None = None, kind: str | None = None,
+              since: datetime | None = None, until: datetime | None = None,
+              limit: int = 100) -> list[dict]:
+        """
+            Return matching submissions, newest first.
+
+            Args:
+                email: Exact applicant email.
+                github_url: Exact GitHub profile URL.
+                submitted_by: Exact technical document submitter email.
+                kind: ``"application"`` or ``"technical_analysis"``.
+                since: Inclusive lower bound on submission time; naive values
+                    are taken as UTC.
+                until: Exclusive upper bound on submission time; naive values
+                    are taken as UTC.
+                limit: Maximum rows returned.
+
+            Returns:
+                List of submission records with ISO 8601 timestamps.
+            """
+        clauses, params = [], []
+        for column, value in (("email", email), ("github_url", github_url),
+                              ("submitted_by", submitted_by), ("kind", kind)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(_utc(since).timestamp())
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(_utc(until).timestamp())
+
+        sql = f"SELECT id, {', '.join(_COLUMNS)} FROM submissions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        connection = self._connect()
+        try:
+            rows = connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+        return [
+            {
+                "id": row[0],
+                "kind": row[1],
+                "created_at": datetime.fromtimestamp(row[2], tz=timezone.utc).isoformat(),
+                "email": row[3],
+                "github_url": row[4],
+                "submitted_by": row[5],
+                "upstream_id": row[6],
+            }
+            for row in rows
+        ]
+
+
+ledger = SubmissionLedger(settings.LEDGER_PATH)
@@ -0,0 +1,65 @@
+#File: app/limits.py
+"""
+Request body size limits enforced at the ASGI layer.
+
+Oversized bodies are rejected with 413 Payload Too Large before FastAPI
+buffers and JSON-parses them: a declared ``Content-Length`` above the limit
+is refused without reading a single byte, and streamed (chunked or
+decompressed) bodies are aborted as soon as the running total crosses it.
+"""
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """
+        ASGI middleware capping request body size per route.
+
+        Args:
+            app: The wrapped ASGI application.
+            default_limit: Byte limit applied to routes without an explicit entry.
+            route_limits: Mapping of request path to byte limit.
+        """
+
+    def __init__(self, app: ASGIApp, default_limit: int, route_limits: dict[str, int] | None = None):
+        self.app = app
+        self.default_limit = default_limit
+        self.route_limits = route_limits or {}
+
+    def limit_for(self, path: str) -> int:
+        """Return the byte limit that applies to ``path``."""
+        return self.route_limits.get(path.rstrip("/") or "/", self.default_limit)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limit_for(scope["path"])
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": f"Request body exceeds {limit} bytes"},
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request body exceeds {limit} bytes",
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
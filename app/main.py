@@ -3,19 +3,78 @@
 Main FastAPI application entry point for WhiteGloveAI Apprentice Proficiency API.
 """
 
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+import hmac
+from contextlib import asynccontextmanager
+from typing import Literal
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from app.admission import AdmissionControlMiddleware, admission
+from app.bulkheads import bulkheads
+from app.client import close_pool, pool_status
+from app.compression import RequestDecompressionMiddleware
+from app.config import settings
+from app.dedup import near_duplicates
+from app.ledger import ledger
+from app.limits import BodySizeLimitMiddleware
+from app.models import format_validation_errors
+from app.profiling import ProfilerBusy, capture_cpu_profile, capture_memory_diff
+from app.readiness import readiness
+from app.scheduling import schedulers
 from app.routers.submit import router as part1_router
 from app.routers.analyze_tech_documents import router as part2_router
+from app.routers.submissions import router as submissions_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+       Application startup/shutdown hook.
+
+       Restores the near-duplicate index from its snapshot on startup and
+       writes it back on shutdown when DEDUP_SNAPSHOT_PATH is configured.
+       Pending submission ledger rows are flushed on shutdown. The readiness
+       checker runs for the lifetime of the app, and the upstream connection
+       pools are closed on shutdown.
+       """
+    if settings.DEDUP_SNAPSHOT_PATH:
+        near_duplicates.load(settings.DEDUP_SNAPSHOT_PATH)
+    readiness.start()
+    yield
+    readiness.stop()
+    if settings.DEDUP_SNAPSHOT_PATH:
+        near_duplicates.save(settings.DEDUP_SNAPSHOT_PATH)
+    ledger.close()
+    close_pool()
+
 
 # Initialize FastAPI application with metadata for OpenAPI documentation
 app = FastAPI(
     title="WhiteGloveAI Apprentice Proficiency",
     description="FastAPI client demonstrating API integration proficiency",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Middleware runs outermost-last: responses are gzipped, request bodies are
+# decompressed, and the decoded body is then size-checked per route before
+# FastAPI buffers it.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    default_limit=settings.MAX_BODY_BYTES,
+    route_limits=settings.ROUTE_BODY_LIMITS,
+)
+app.add_middleware(
+    RequestDecompressionMiddleware,
+    max_decompressed_bytes=settings.REQUEST_MAX_DECOMPRESSED_BYTES,
+    route_limits=settings.ROUTE_BODY_LIMITS,
+)
+app.add_middleware(GZipMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES)
+# Outermost: shed load before any body is read.
+app.add_middleware(AdmissionControlMiddleware, controller=admission)
+
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -33,14 +92,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
            JSONResponse with structured error details including field names,
            error messages, and error types.
        """
-    errors = []
-    for error in exc.errors():
-        field = " -> ".join(str(loc) for loc in error["loc"] if loc != "body")
-        errors.append({
-            "field": field,
-            "message": error["msg"],
-            "type": error["type"]
-        })
+    errors = format_validation_errors(exc.errors())
 
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -54,6 +106,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 # Register routers for different API sections
 app.include_router(part1_router) #submition
 app.include_router(part2_router) #technical analyze document submission
+app.include_router(submissions_router) #local submission ledger lookups
 
 @app.get("/health", tags=["health"])
 def health_check():
@@ -63,4 +116,136 @@ def health_check():
        Returns:
            Simple status object indicating the service is operational.
        """
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@app.get("/health/ready", tags=["health"])
+async def readiness_check(response: Response):
+    """
+       Readiness probe backed by a cached background check.
+
+       Reports config and upstream reachability from the most recent
+       background run, with its age. Never calls WGAI itself.
+
+       Returns:
+           Cached readiness result; 503 when not ready or the result is stale.
+       """
+    readiness.start()
+    result = readiness.status()
+    if not result["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
+
+
+@app.get("/health/tenants", tags=["health"])
+def tenant_metrics():
+    """
+       Per-tenant upstream scheduling metrics.
+
+       Returns:
+           In-flight and waiting counts plus average/max queue time for each
+           tenant sharing the WGAI upstream, keyed by phase.
+       """
+    return {phase: scheduler.snapshot() for phase, scheduler in schedulers.items()}
+
+
+@app.get("/health/bulkheads", tags=["health"])
+def bulkhead_metrics():
+    """
+       Utilization of the Phase 1 and Phase 2 bulkheads.
+
+       Returns:
+           For each phase: worker slots in use versus capacity, queued and
+           rejected requests, and its upstream connection pool.
+       """
+    pools = pool_status()
+    return {
+        phase: {**bulkhead.snapshot(), "connection_pool": pools[phase]}
+        for phase, bulkhead in bulkheads.items()
+    }
+
+
+@app.get("/health/load", tags=["health"])
+def load_check(response: Response):
+    """
+       Load probe for load balancers.
+
+       Returns:
+           Current in-flight requests versus capacity. Responds with 503 while
+           the instance is saturated so traffic can be routed elsewhere.
+       """
+    snapshot = admission.snapshot()
+    if snapshot["saturated"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return snapshot
+
+
+def require_debug_token(x_debug_token: str | None = Header(None)):
+    """
+       Guard for debug endpoints.
+
+       Debug endpoints answer 404 unless DEBUG_TOKEN is configured and the
+       request carries a matching X-Debug-Token header.
+       """
+    if not settings.DEBUG_TOKEN or x_debug_token is None or not hmac.compare_digest(
+            x_debug_token.encode(), settings.DEBUG_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+@app.get("/debug/profile/cpu", tags=["debug"], dependencies=[Depends(require_debug_token)])
+def cpu_profile(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILE_MAX_SECONDS),
+    format: Literal["collapsed", "pstats", "json"] = "collapsed",
+):
+    """
+       Capture a sampling CPU profile of live traffic.
+
+       Threads idling in lock, queue or selector waits are skipped; threads
+       blocked on I/O are still sampled.
+
+       Args:
+           seconds: Capture window, bounded by PROFILE_MAX_SECONDS.
+           format: "collapsed" (flame graph input), "pstats" (load with
+               pstats.Stats) or "json" (top functions by samples).
+
+       Returns:
+           The profile as a downloadable file, or JSON.
+       """
+    try:
+        profile = capture_cpu_profile(seconds)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+
+    if format == "json":
+        return profile.as_dict()
+    if format == "pstats":
+        return Response(
+            content=profile.pstats(),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="cpu.pstats"'},
+        )
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={"Content-Disposition": 'attachment; filename="cpu.collapsed"'},
+    )
+
+
+@app.get("/debug/profile/memory", tags=["debug"], dependencies=[Depends(require_debug_token)])
+def memory_profile(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILE_MAX_SECONDS),
+    top: int = Query(25, ge=1, le=500),
+):
+    """
+       Report the top allocation sites over a tracemalloc capture window.
+
+       Args:
+           seconds: Capture window, bounded by PROFILE_MAX_SECONDS.
+           top: Number of source lines to report.
+
+       Returns:
+           JSON snapshot diff ordered by allocated size growth.
+       """
+    try:
+        return capture_memory_diff(seconds, top=top)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
\ No newline at end of file
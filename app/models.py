@@ -7,7 +7,29 @@ ensuring data integrity and type safety across the application.
 """
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import List
+from typing import Any, List
+from app.config import settings
+
+
+def format_validation_errors(errors: List[dict[str, Any]]) -> List[dict[str, str]]:
+    """
+        Flatten Pydantic error dicts into the API's ``field/message/type`` shape.
+
+        Args:
+            errors: Output of ``ValidationError.errors()`` or ``RequestValidationError.errors()``.
+
+        Returns:
+            List of error objects with a ``" -> "`` joined field path.
+        """
+    return [
+        {
+            "field": " -> ".join(str(loc) for loc in error["loc"] if loc != "body"),
+            "message": error["msg"],
+            "type": error["type"]
+        }
+        for error in errors
+    ]
+
 
 class ApplicationRequest(BaseModel):
     """
@@ -21,6 +43,7 @@ class ApplicationRequest(BaseModel):
         description="Github profile endpoint, should match valid GitHub profile format")
     background: str = Field(...,
         min_length=50,
+        max_length=settings.MAX_TEXT_CHARS,
         description="Technical background summary (minimum 50 characters)")
     full_name: str = Field(
         ...,
@@ -34,6 +57,7 @@ class ApplicationRequest(BaseModel):
     skills: List[str] = Field(
         ...,
         min_length=1,
+        max_length=settings.MAX_LIST_ITEMS,
         description="Technical capability array (non-empty)")
     position_applied: str = Field(...,
          min_length=1,
@@ -97,21 +121,25 @@ class TechnicalAnalysisRequest(BaseModel):
     synopsis: str = Field(
         ...,
         min_length=100,
+        max_length=settings.MAX_TEXT_CHARS,
         description="Technical document synopsis (minimum 100 characters)"
     )
     key_concepts: List[str] = Field(
         ...,
         min_length=3,
+        max_length=settings.MAX_LIST_ITEMS,
         description="Key concepts array (minimum 3 items)"
     )
     technical_details: List[str] = Field(
         ...,
         min_length=3,
+        max_length=settings.MAX_LIST_ITEMS,
         description="Technical details array (minimum 3 items)"
     )
     analysis: str = Field(
         ...,
         min_length=200,
+        max_length=settings.MAX_TEXT_CHARS,
         description="Technical analysis (minimum 200 characters)"
     )
     submitted_by: EmailStr = Field(
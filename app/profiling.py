@@ -0,0 +1,203 @@
+#File: app/profiling.py
+"""
+On-demand CPU and memory profiling of a running instance.
+
+Both profilers only exist for the duration of a capture, so they cost
+nothing when idle:
+
+* CPU: a sampling profiler thread reads every thread's stack through
+  ``sys._current_frames()`` at a fixed interval and aggregates the samples.
+  Threads parked in a known idle wait (lock/condition waits, ``queue.get``,
+  ``selectors`` polls) are skipped, so idle anyio workers, the ledger writer
+  and the readiness checker do not drown out real work. Threads blocked in
+  other calls, such as socket reads, are still sampled: treat the result as
+  on-CPU time plus I/O wait. Results export as collapsed stacks (flame graph
+  input), a ``pstats`` compatible marshal file, or JSON.
+* Memory: ``tracemalloc`` is started for the window, and the top allocation
+  sites are reported as a snapshot diff.
+
+Only one capture runs at a time.
+"""
+
+import marshal
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+# (file basename, function) of leaf frames that mean "blocked, doing nothing".
+IDLE_FRAMES = frozenset({
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+})
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a capture is requested while another one is running."""
+
+
+_capture_lock = threading.Lock()
+
+
+def _frame_key(frame) -> tuple[str, int, str]:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _is_idle(frame) -> bool:
+    """True when a thread's leaf frame is one of the known idle waits."""
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+
+
+def _stack(frame) -> tuple[tuple[str, int, str], ...]:
+    """Return the stack of ``frame`` ordered root first."""
+    keys = []
+    while frame is not None:
+        keys.append(_frame_key(frame))
+        frame = frame.f_back
+    keys.reverse()
+    return tuple(keys)
+
+
+class CpuProfile:
+    """Aggregated stack samples from a sampling capture."""
+
+    def __init__(self, samples: Counter, interval: float, duration: float, idle_samples: int = 0):
+        self.samples = samples
+        self.interval = interval
+        self.duration = duration
+        self.idle_samples = idle_samples
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed-stack format, one ``a;b;c count`` line per stack."""
+        lines = []
+        for stack, count in self.samples.most_common():
+            frames = ";".join(f"{name} ({filename}:{line})" for filename, line, name in stack)
+            lines.append(f"{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def pstats(self) -> bytes:
+        """Marshal dump loadable with ``pstats.Stats(path)`` (times estimated from samples)."""
+        stats: dict = {}
+        for stack, count in self.samples.items():
+            seconds = count * self.interval
+            for key in set(stack):
+                nc, cc, tt, ct, callers = stats.setdefault(key, (0, 0, 0.0, 0.0, {}))
+                stats[key] = (nc + count, cc + count, tt, ct + seconds, callers)
+            leaf = stack[-1]
+            nc, cc, tt, ct, callers = stats[leaf]
+            stats[leaf] = (nc, cc, tt + seconds, ct, callers)
+            for caller, callee in zip(stack, stack[1:]):
+                callers = stats[callee][4]
+                callers[caller] = callers.get(caller, 0) + count
+        return marshal.dumps(stats)
+
+    def as_dict(self, top: int = 50) -> dict:
+        """JSON-friendly summary: self and inclusive sample counts per function."""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.samples.items():
+            self_counts[stack[-1]] += count
+            for key in set(stack):
+                total_counts[key] += count
+
+        def describe(key, count):
+            filename, line, name = key
+            return {"function": name, "file": filename, "line": line, "samples": count}
+
+        return {
+            "duration_s": round(self.duration, 3),
+            "interval_s": self.interval,
+            "total_samples": sum(self.samples.values()),
+            "idle_samples_skipped": self.idle_samples,
+            "self": [describe(k, c) for k, c in self_counts.most_common(top)],
+            "inclusive": [describe(k, c) for k, c in total_counts.most_common(top)],
+        }
+
+
+def capture_cpu_profile(seconds: float, interval: float = 0.005) -> CpuProfile:
+    """
+        Sample every thread's stack for ``seconds`` and return the aggregate.
+
+        The calling thread, the sampler itself and threads idling in one
+        of ``IDLE_FRAMES`` are excluded.
+
+        Raises:
+            ProfilerBusy: If another capture is in progress.
+        """
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile capture is already running")
+    try:
+        samples: Counter = Counter()
+        idle = 0
+        caller_id = threading.get_ident()
+        stop = threading.Event()
+
+        def sample():
+            nonlocal idle
+            sampler_id = threading.get_ident()
+            while not stop.wait(interval):
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id in (caller_id, sampler_id):
+                        continue
+                    if _is_idle(frame):
+                        idle += 1
+                    else:
+                        samples[_stack(frame)] += 1
+
+        started = time.monotonic()
+        sampler = threading.Thread(target=sample, name="cpu-profiler", daemon=True)
+        sampler.start()
+        time.sleep(seconds)
+        stop.set()
+        sampler.join()
+        return CpuProfile(samples, interval, time.monotonic() - started, idle)
+    finally:
+        _capture_lock.release()
+
+
+def capture_memory_diff(seconds: float, top: int = 25, frames: int = 1) -> dict:
+    """
+        Trace allocations for ``seconds`` and report the top growth by source line.
+
+        Raises:
+            ProfilerBusy: If another capture is in progress.
+        """
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile capture is already running")
+    already_tracing = tracemalloc.is_tracing()
+    try:
+        if not already_tracing:
+            tracemalloc.start(frames)
+        before = tracemalloc.take_snapshot()
+        time.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+        _capture_lock.release()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    return {
+        "duration_s": seconds,
+        "traced_bytes": traced,
+        "peak_bytes": peak,
+        "top": [
+            {
+                "file": stat.traceback[0].filename,
+                "line": stat.traceback[0].lineno,
+                "size_diff": stat.size_diff,
+                "size": stat.size,
+                "count_diff": stat.count_diff,
+                "count": stat.count,
+            }
+            for stat in diff[:top]
+        ],
+    }
@@ -0,0 +1,149 @@
+#File: app/readiness.py
+"""
+Deep readiness probe.
+
+``/health`` only says the process is alive. Readiness also requires the WGAI
+settings to be present and ``WGAI_SERVER_URL`` to be reachable. The upstream
+probe uses its own single-connection client, never the request pools, so a
+busy but healthy instance does not fail readiness waiting for a connection. Checking upstream on every probe hit
+would hammer WGAI from every instance. Instead, a background thread runs the
+checks every READINESS_INTERVAL_SECONDS, and ``/health/ready`` serves the
+cached result together with its age. A result older than three intervals is
+reported as stale and not ready.
+"""
+
+import threading
+import time
+from typing import Callable
+
+import httpx
+
+from app.config import settings
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+STALE_AFTER_INTERVALS = 3
+
+
+def check_config() -> dict:
+    """Verify that every setting WGAIClient needs is present."""
+    missing = [
+        name for name, value in (
+            ("WGAI_SERVER_URL", settings.WGAI_BASE_URL),
+            ("WGAI_API_KEY_PHASE1", settings.API_KEY_PHASE1),
+            ("WGAI_API_KEY_PHASE2", settings.API_KEY_PHASE2),
+        ) if not value
+    ]
+    return {"ok": not missing, "missing": missing}
+
+
+def check_upstream(timeout: float, client: httpx.Client) -> dict:
+    """
+        Verify WGAI_SERVER_URL answers HTTP at all.
+
+        Any HTTP response counts as reachable (auth and routing are not the
+        probe's concern); connection errors and timeouts do not.
+        """
+    if not settings.WGAI_BASE_URL:
+        return {"ok": False, "error": "WGAI_SERVER_URL is not configured"}
+    started = time.monotonic()
+    try:
+        response = client.head(settings.WGAI_BASE_URL, timeout=timeout)
+    except httpx.HTTPError as exc:
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "ok": True,
+        "status_code": response.status_code,
+        "latency_ms": round(1000 * (time.monotonic() - started), 1),
+    }
+
+
+class ReadinessChecker:
+    """
+        Periodically runs readiness checks and caches the outcome.
+
+        Args:
+            interval: Seconds between background checks.
+            timeout: Upstream probe timeout in seconds.
+            checks: Mapping of check name to a zero-argument callable
+                returning a dict with an ``ok`` key; defaults to config and
+                upstream checks.
+        """
+
+    def __init__(self, interval: float, timeout: float, checks: dict[str, Callable[[], dict]] | None = None):
+        self.interval = interval
+        self.timeout = timeout
+        self.checks = checks or {
+            "config": check_config,
+            "upstream": lambda: check_upstream(self.timeout, self._probe_client()),
+        }
+        self._client: httpx.Client | None = None
+        self._result: dict | None = None
+        self._checked_at: float | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def _probe_client(self) -> httpx.Client:
+        """Dedicated client for the upstream probe, separate from request traffic."""
+        if self._client is None:
+            self._client = httpx.Client(limits=httpx.Limits(max_connections=1))
+        return self._client
+
+    def check_once(self) -> dict:
+        """Run every check now and cache the combined result."""
+        results = {}
+        for name, check in self.checks.items():
+            try:
+                results[name] = check()
+            except Exception as exc:
+                logger.exception("Readiness check %s failed", name)
+                results[name] = {"ok": False, "error": str(exc)}
+        self._result = {"ready": all(r["ok"] for r in results.values()), "checks": results}
+        self._checked_at = time.monotonic()
+        return self._result
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.check_once()
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Start the background checker if it is not already running."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="readiness-checker", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background checker."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def status(self) -> dict:
+        """Return the cached result with its age; never performs a check."""
+        if self._result is None:
+            return {"ready": False, "stale": True, "age_s": None, "checks": {}}
+        age = time.monotonic() - self._checked_at
+        stale = age > self.interval * STALE_AFTER_INTERVALS
+        return {
+            "ready": self._result["ready"] and not stale,
+            "stale": stale,
+            "age_s": round(age, 3),
+            "checks": self._result["checks"],
+        }
+
+
+readiness = ReadinessChecker(
+    interval=settings.READINESS_INTERVAL_SECONDS,
+    timeout=settings.READINESS_TIMEOUT_SECONDS,
+)
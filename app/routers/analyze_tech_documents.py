@@ -7,18 +7,27 @@ AI-generated technical analysis.
 """
 
 #File: app/routers/submit.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Request, Response
 from app.models import TechnicalAnalysisRequest
+from app.binary import BinaryBodyRoute
+from app.bulkheads import PHASE2, BulkheadFull, bulkheads
 from app.client import WGAIClient
+from app.config import settings
+from app.deliverability import deliverability
+from app.dedup import NearDuplicate, document_fingerprint, near_duplicates
+from app.scheduling import tenant_label
+from app.streaming import ItemResult, stream_batch
 
 router = APIRouter(
     prefix="/analyze",
     tags=["tech-documents"],
+    route_class=BinaryBodyRoute,
 )
 
 
 @router.post("/tech-documents")
-def analyze_tech_docs(payload: TechnicalAnalysisRequest):
+async def analyze_tech_docs(payload: TechnicalAnalysisRequest, response: Response,
+                            x_wgai_api_key: str | None = Header(None)):
     """
         Submit a technical document for AI-powered analysis.
 
@@ -32,26 +41,137 @@ def analyze_tech_docs(payload: TechnicalAnalysisRequest):
                 - technical_details: Implementation specifics (min 3 items)
                 - analysis: Detailed technical breakdown (min 200 chars)
                 - submitted_by: Submitter's email for tracking
+            x_wgai_api_key: Optional caller-owned WGAI key (``X-WGAI-API-Key``)
+                used instead of API_KEY_PHASE2; each distinct key is scheduled
+                as its own tenant.
 
         Returns:
             dict: WGAI analysis response containing processed insights
                   and document evaluation results.
 
         Raises:
-            HTTPException (400): When payload fails validation constraints.
+            HTTPException (400): When payload fails validation constraints, or
+                the submitter's email domain cannot receive mail (when
+                EMAIL_DELIVERABILITY_CHECK is enabled).
+            HTTPException (409): When the document is a near-duplicate of a
+                previous submission and DEDUP_POLICY is "reject".
             HTTPException (500): When WGAI API is unreachable or returns an error.
+            HTTPException (503): When every Phase 2 slot is busy and the
+                bulkhead's wait queue is full.
 
         Note:
             This endpoint uses API_KEY_PHASE2 for authentication,
             distinct from the application submission endpoint.
+
+            Near-duplicates of earlier documents are reported through the
+            X-Near-Duplicate-Of / X-Near-Duplicate-Distance headers. With
+            DEDUP_POLICY "reuse" the earlier analysis is returned without
+            calling WGAI again. Only documents submitted under the same
+            X-WGAI-API-Key (or none) are compared.
+
+            Fingerprinting and the WGAI call run in the Phase 2 bulkhead, so
+            a surge of analyses cannot starve application submissions.
         """
-    client = WGAIClient()
+    await deliverability.ensure_deliverable(payload.submitted_by, "submitted_by")
+
+    tenant = tenant_label(x_wgai_api_key)
 
     try:
-        result = client.analyze_technical_document(payload)
-        return result
+        result, match = await bulkheads[PHASE2].run(_analyze, payload, None, x_wgai_api_key, tenant=tenant)
+    except BulkheadFull as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=str(exc),
+            headers={"Retry-After": str(settings.SHED_RETRY_AFTER_SECONDS)}
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(
             status_code=500,
             detail=str(exc)
-        )
\ No newline at end of file
+        )
+
+    if match is not None:
+        response.headers.update(_duplicate_headers(match))
+    return result
+
+
+def _duplicate_headers(match: NearDuplicate) -> dict:
+    return {
+        "X-Near-Duplicate-Of": str(match.entry_id),
+        "X-Near-Duplicate-Distance": str(match.distance),
+    }
+
+
+def _analyze(payload: TechnicalAnalysisRequest, client: WGAIClient | None = None,
+             api_key: str | None = None) -> tuple[dict, NearDuplicate | None]:
+    """
+        Apply DEDUP_POLICY, then call WGAI unless a prior result is reused.
+
+        Shared by the single and streaming endpoints; runs on a Phase 2
+        worker thread. The client is only created when WGAI is actually
+        called, unless one is passed in.
+
+        Returns:
+            Tuple of (analysis result, near-duplicate match or None).
+
+        Raises:
+            HTTPException (409): When the document is a near-duplicate and
+                DEDUP_POLICY is "reject".
+        """
+    policy = settings.DEDUP_POLICY
+    if policy == "off":
+        return (client or WGAIClient()).analyze_technical_document(payload, api_key), None
+
+    fingerprint = document_fingerprint(payload)
+    tenant = tenant_label(api_key)
+    match = near_duplicates.find(fingerprint, tenant)
+    if match is not None:
+        if policy == "reject":
+            raise HTTPException(
+                status_code=409,
+                detail=f"Near-duplicate of previously analyzed document {match.entry_id}",
+                headers=_duplicate_headers(match)
+            )
+        if policy == "reuse" and match.result is not None:
+            return match.result, match
+
+    result = (client or WGAIClient()).analyze_technical_document(payload, api_key)
+    near_duplicates.add(fingerprint, result, tenant)
+    return result, match
+
+
+@router.post("/tech-documents/stream")
+async def analyze_tech_docs_stream(request: Request, x_wgai_api_key: str | None = Header(None)):
+    """
+        Analyze a batch of technical documents, streaming back each result.
+
+        The request body holds one TechnicalAnalysisRequest per item, as NDJSON
+        (one object per line), a MessagePack stream or a CBOR sequence. Each
+        WGAI analysis is written back as soon as it completes, with periodic
+        progress events and a final summary.
+
+        DEDUP_POLICY applies to every item: near-duplicates carry
+        ``near_duplicate_of`` / ``near_duplicate_distance`` on their result
+        event, and rejected ones are reported as 409 ``rejected`` errors.
+
+        Args:
+            request: Incoming request carrying the NDJSON body.
+            x_wgai_api_key: Optional caller-owned WGAI key applied to every item.
+
+        Returns:
+            StreamingResponse: NDJSON events, or Server-Sent Events when the
+            caller sends ``Accept: text/event-stream``.
+        """
+    client = WGAIClient()
+
+    def analyze_item(payload: TechnicalAnalysisRequest) -> dict | ItemResult:
+        result, match = _analyze(payload, client, x_wgai_api_key)
+        if match is None:
+            return result
+        return ItemResult(result, {"near_duplicate_of": match.entry_id, "near_duplicate_distance": match.distance})
+
+    return stream_batch(request, TechnicalAnalysisRequest, analyze_item,
+                        email_field="submitted_by", bulkhead=bulkheads[PHASE2],
+                        tenant=tenant_label(x_wgai_api_key))
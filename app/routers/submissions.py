@@ -0,0 +1,75 @@
+#File: app/routers/submissions.py
+
+"""
+Submission Ledger Router
+
+Query endpoint over the local submission ledger, answering "has this
+candidate/document already been submitted?" without calling WGAI.
+
+Records contain applicant emails and GitHub URLs, so the endpoint answers
+404 unless LEDGER_TOKEN is configured, and 401 unless the request carries a
+matching X-Ledger-Token header.
+"""
+
+import hmac
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from app.config import settings
+from app.ledger import ledger
+
+
+def require_ledger_token(x_ledger_token: str | None = Header(None)):
+    """Guard the ledger query API with LEDGER_TOKEN."""
+    if not settings.LEDGER_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_ledger_token is None or not hmac.compare_digest(
+            x_ledger_token.encode(), settings.LEDGER_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or missing X-Ledger-Token")
+
+
+router = APIRouter(
+    prefix="/submissions",
+    tags=["submissions"],
+    dependencies=[Depends(require_ledger_token)],
+)
+
+
+@router.get("")
+def list_submissions(
+    email: str | None = None,
+    github_url: str | None = None,
+    submitted_by: str | None = None,
+    kind: Literal["application", "technical_analysis"] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """
+        Look up recorded submissions, newest first.
+
+        Args:
+            email: Applicant email (Phase 1 submissions).
+            github_url: Applicant GitHub profile URL (Phase 1 submissions).
+            submitted_by: Document submitter email (Phase 2 submissions).
+            kind: Restrict to "application" or "technical_analysis".
+            since: Only submissions at or after this time (ISO 8601; UTC
+                when no offset is given).
+            until: Only submissions before this time (ISO 8601; UTC when no
+                offset is given).
+            limit: Maximum number of records returned (1-1000).
+
+        Returns:
+            dict: Matching records and their count.
+        """
+    items = ledger.query(
+        email=email,
+        github_url=github_url,
+        submitted_by=submitted_by,
+        kind=kind,
+        since=since,
+        until=until,
+        limit=limit,
+    )
+    return {"count": len(items), "items": items}
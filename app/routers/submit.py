@@ -8,18 +8,27 @@ This module serves as the interface between incoming client requests
 and the external WGAI service.
 """
 
-from fastapi import APIRouter, HTTPException
+from functools import partial
+
+from fastapi import APIRouter, Header, HTTPException, Request
 from app.models import ApplicationRequest
+from app.binary import BinaryBodyRoute
+from app.bulkheads import PHASE1, BulkheadFull, bulkheads
 from app.client import WGAIClient
+from app.config import settings
+from app.deliverability import deliverability
+from app.scheduling import tenant_label
+from app.streaming import stream_batch
 
 router = APIRouter(
     prefix="/submit",
     tags=["application"],
+    route_class=BinaryBodyRoute,
 )
 
 
 @router.post("/application")
-def submit_application(payload: ApplicationRequest):
+async def submit_application(payload: ApplicationRequest, x_wgai_api_key: str | None = Header(None)):
     """
         Submit a job application to the WhiteGloveAI system.
 
@@ -29,24 +38,65 @@ def submit_application(payload: ApplicationRequest):
         Args:
             payload: Validated application data including personal info,
                      skills, and experience details.
+            x_wgai_api_key: Optional caller-owned WGAI key (``X-WGAI-API-Key``)
+                     used instead of API_KEY_PHASE1; each distinct key is
+                     scheduled as its own tenant.
 
         Returns:
             dict: Response from WGAI API containing submission confirmation
                   and any additional processing details.
 
         Raises:
-            HTTPException (400): When payload validation fails (handled by FastAPI).
+            HTTPException (400): When payload validation fails (handled by FastAPI),
+                or the email domain cannot receive mail (when
+                EMAIL_DELIVERABILITY_CHECK is enabled).
             HTTPException (500): When WGAI API communication fails.
-        """
+            HTTPException (503): When every Phase 1 slot is busy and the
+                bulkhead's wait queue is full.
 
+        Note:
+            The WGAI call runs in the Phase 1 bulkhead, so a backlog of
+            Phase 2 analyses never delays application submissions.
+        """
+    await deliverability.ensure_deliverable(payload.email, "email")
 
     client = WGAIClient()
+    tenant = tenant_label(x_wgai_api_key)
 
     try:
-        result = client.submit_application(payload)
+        result = await bulkheads[PHASE1].run(client.submit_application, payload, x_wgai_api_key, tenant=tenant)
         return result
+    except BulkheadFull as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=str(exc),
+            headers={"Retry-After": str(settings.SHED_RETRY_AFTER_SECONDS)}
+        )
     except Exception as exc:
         raise HTTPException(
             status_code=500,
             detail=str(exc)
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/applications/stream")
+async def submit_applications_stream(request: Request, x_wgai_api_key: str | None = Header(None)):
+    """
+        Submit a batch of job applications, streaming back each result.
+
+        The request body holds one ApplicationRequest per item, as NDJSON
+        (one object per line), a MessagePack stream or a CBOR sequence. Each
+        WGAI response is written back as soon as it completes, with periodic
+        progress events and a final summary.
+
+        Args:
+            request: Incoming request carrying the NDJSON body.
+            x_wgai_api_key: Optional caller-owned WGAI key applied to every item.
+
+        Returns:
+            StreamingResponse: NDJSON events, or Server-Sent Events when the
+            caller sends ``Accept: text/event-stream``.
+        """
+    client = WGAIClient()
+    return stream_batch(request, ApplicationRequest, partial(client.submit_application, api_key=x_wgai_api_key),
+                        email_field="email", bulkhead=bulkheads[PHASE1], tenant=tenant_label(x_wgai_api_key))
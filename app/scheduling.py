@@ -0,0 +1,279 @@
+#File: app/scheduling.py
+"""
+Per-tenant admission scheduling for upstream WGAI calls.
+
+Every upstream request made by ``WGAIClient`` takes a slot from its phase's
+``TenantScheduler`` first; Phase 1 and Phase 2 have separate schedulers so
+one phase can never hold the other's slots. The HTTP routes take the slot
+on the event loop (``async_slot``) inside the phase's bulkhead, so queued
+requests wait here, in fair order, without holding a worker thread; the
+bulkhead decides whether a request may queue at all. When slots are scarce,
+waiting requests are granted in weighted fair queuing order (start-time fair queuing): each
+request is tagged with a virtual finish time of ``start + 1 / weight``, and
+the smallest tag among tenants that are under their own concurrency cap goes
+next. A tenant flooding the queue only pushes its own tags further out, so
+other tenants' interactive requests keep getting through.
+
+Tenants are identified by the API key used for the call: requests using the
+configured environment keys belong to ``"default"``, and each ``api_key``
+override maps to ``"key-<sha256 prefix>"`` so raw keys never show up in
+metrics or configuration. HTTP callers supply their own key with the
+``X-WGAI-API-Key`` header, which the routers pass through to ``WGAIClient``.
+
+Override tenants are forgotten as soon as they have nothing queued or in
+flight, so one-off keys do not accumulate; ``"default"`` and tenants with a
+configured weight are always kept for their metrics.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Callable
+
+from app.config import settings
+
+DEFAULT_TENANT = "default"
+PHASE1 = "phase1"
+PHASE2 = "phase2"
+
+
+def tenant_label(api_key: str | None) -> str:
+    """Return the scheduling tenant for an optional API key override."""
+    if api_key is None:
+        return DEFAULT_TENANT
+    return "key-" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class _Ticket:
+    start: float
+    finish: float
+    seq: int
+    granted: bool = False
+    on_grant: Callable[[], None] | None = None
+
+
+@dataclass
+class _TenantState:
+    weight: float
+    last_finish: float = 0.0
+    active: int = 0
+    queue: deque = field(default_factory=deque)
+    admitted: int = 0
+    queue_time_total: float = 0.0
+    queue_time_max: float = 0.0
+
+
+class TenantScheduler:
+    """
+        Weighted fair scheduler bounding concurrent upstream calls.
+
+        Args:
+            max_concurrency: Total upstream calls allowed in flight.
+            tenant_max_concurrency: Calls a single tenant may have in flight.
+            weights: Relative share per tenant label; unlisted tenants get 1.
+        """
+
+    def __init__(self, max_concurrency: int, tenant_max_concurrency: int, weights: dict[str, int] | None = None):
+        self.max_concurrency = max_concurrency
+        self.tenant_max_concurrency = tenant_max_concurrency
+        self.weights = weights or {}
+        self._cond = threading.Condition()
+        self._tenants: dict[str, _TenantState] = {}
+        self._active = 0
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+        # Set while the current context holds a slot, so a nested slot() on
+        # the same scheduler (e.g. WGAIClient inside a bulkhead) is a no-op.
+        self._held = contextvars.ContextVar(f"tenant_slot_{id(self)}", default=False)
+
+    def _state(self, tenant: str) -> _TenantState:
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = _TenantState(weight=float(self.weights.get(tenant, 1)))
+            self._tenants[tenant] = state
+        return state
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the eligible tickets with the smallest finish tags."""
+        while self._active < self.max_concurrency:
+            best_state = None
+            for state in self._tenants.values():
+                if state.queue and state.active < self.tenant_max_concurrency:
+                    head = state.queue[0]
+                    if best_state is None or (head.finish, head.seq) < (best_state.queue[0].finish, best_state.queue[0].seq):
+                        best_state = state
+            if best_state is None:
+                return
+            ticket = best_state.queue.popleft()
+            ticket.granted = True
+            best_state.active += 1
+            self._active += 1
+            self._virtual_time = max(self._virtual_time, ticket.start)
+            if ticket.on_grant is not None:
+                ticket.on_grant()
+
+    def _enqueue(self, tenant: str, on_grant: Callable[[], None] | None = None) -> _Ticket:
+        """Tag and queue a ticket, then dispatch; caller holds ``_cond``."""
+        state = self._state(tenant)
+        start = max(self._virtual_time, state.last_finish)
+        ticket = _Ticket(start=start, finish=start + 1.0 / state.weight, seq=next(self._seq), on_grant=on_grant)
+        state.last_finish = ticket.finish
+        state.queue.append(ticket)
+        self._dispatch()
+        self._cond.notify_all()
+        return ticket
+
+    def _acquire(self, tenant: str) -> None:
+        with self._cond:
+            ticket = self._enqueue(tenant)
+            while not ticket.granted:
+                self._cond.wait()
+
+    async def _acquire_async(self, tenant: str, on_queue: Callable[[], None] | None = None) -> None:
+        """Wait for a slot without tying up a thread; cancellation gives the ticket back."""
+        loop = asyncio.get_running_loop()
+        granted = asyncio.Event()
+        with self._cond:
+            state = self._state(tenant)
+            last_finish = state.last_finish
+            ticket = self._enqueue(tenant, on_grant=lambda: loop.call_soon_threadsafe(granted.set))
+            if ticket.granted:
+                # Free slot: return without yielding, so the caller never
+                # looks queued to requests arriving in the meantime.
+                return
+            if on_queue is not None:
+                try:
+                    on_queue()
+                except BaseException:
+                    # Refused before it ever waited: withdraw the ticket
+                    # without charging the tenant for it.
+                    state.queue.remove(ticket)
+                    state.last_finish = last_finish
+                    self._evict_if_idle(tenant, state)
+                    raise
+        try:
+            await granted.wait()
+        except BaseException:
+            with self._cond:
+                state = self._tenants[tenant]
+                if ticket.granted:
+                    state.active -= 1
+                    self._active -= 1
+                else:
+                    state.queue.remove(ticket)
+                self._evict_if_idle(tenant, state)
+                self._dispatch()
+                self._cond.notify_all()
+            raise
+
+    def _record_wait(self, tenant: str, waited: float) -> None:
+        with self._cond:
+            state = self._tenants[tenant]
+            state.admitted += 1
+            state.queue_time_total += waited
+            state.queue_time_max = max(state.queue_time_max, waited)
+
+    def _release(self, tenant: str) -> None:
+        with self._cond:
+            state = self._tenants[tenant]
+            state.active -= 1
+            self._active -= 1
+            self._evict_if_idle(tenant, state)
+            self._dispatch()
+            self._cond.notify_all()
+
+    def _evict_if_idle(self, tenant: str, state: _TenantState) -> None:
+        """Drop an idle override tenant so distinct keys cannot grow ``_tenants`` forever."""
+        if state.active or state.queue or tenant == DEFAULT_TENANT or tenant in self.weights:
+            return
+        del self._tenants[tenant]
+
+    @contextmanager
+    def slot(self, tenant: str):
+        """
+            Hold one upstream slot for ``tenant`` for the duration of the block.
+
+            Blocks the calling thread until the scheduler grants the slot, and
+            records how long the request spent queued. Does nothing when the
+            current context already holds a slot from this scheduler.
+            """
+        if self._held.get():
+            yield
+            return
+        enqueued = time.monotonic()
+        self._acquire(tenant)
+        self._record_wait(tenant, time.monotonic() - enqueued)
+        token = self._held.set(True)
+        try:
+            yield
+        finally:
+            self._held.reset(token)
+            self._release(tenant)
+
+    @asynccontextmanager
+    async def async_slot(self, tenant: str, on_queue: Callable[[], None] | None = None):
+        """
+            Async variant of :meth:`slot` for the event loop.
+
+            Waiting requests sit in the weighted fair queue without holding a
+            thread. The held slot carries over into worker threads started
+            from the block (anyio copies the context), where a nested
+            :meth:`slot` on this scheduler does not acquire a second one.
+
+            Args:
+                tenant: Scheduling tenant of the request.
+                on_queue: Called under the scheduler lock when no slot is free
+                    and the request is about to wait. Raising from it refuses
+                    the request; the exception propagates out of the block.
+            """
+        enqueued = time.monotonic()
+        await self._acquire_async(tenant, on_queue)
+        self._record_wait(tenant, time.monotonic() - enqueued)
+        token = self._held.set(True)
+        try:
+            yield
+        finally:
+            self._held.reset(token)
+            self._release(tenant)
+
+    def snapshot(self) -> dict:
+        """Return current load and queue-time metrics per tenant."""
+        with self._cond:
+            return {
+                "active": self._active,
+                "max_concurrency": self.max_concurrency,
+                "tenants": {
+                    tenant: {
+                        "weight": state.weight,
+                        "active": state.active,
+                        "waiting": len(state.queue),
+                        "admitted": state.admitted,
+                        "queue_time_avg_ms": round(1000 * state.queue_time_total / state.admitted, 3) if state.admitted else 0.0,
+                        "queue_time_max_ms": round(1000 * state.queue_time_max, 3),
+                    }
+                    for tenant, state in self._tenants.items()
+                },
+            }
+
+
+# Unless TENANT_MAX_CONCURRENCY is set, one tenant may use the whole phase:
+# most deployments only ever see "default", which must not be throttled
+# below the phase's capacity.
+schedulers = {
+    phase: TenantScheduler(
+        max_concurrency=max_concurrency,
+        tenant_max_concurrency=min(settings.TENANT_MAX_CONCURRENCY or max_concurrency, max_concurrency),
+        weights=settings.TENANT_WEIGHTS,
+    )
+    for phase, max_concurrency in (
+        (PHASE1, settings.PHASE1_MAX_CONCURRENCY),
+        (PHASE2, settings.PHASE2_MAX_CONCURRENCY),
+    )
+}
@@ -0,0 +1,292 @@
+#File: app/streaming.py
+"""
+Streaming batch processing.
+
+Batch endpoints read newline-delimited JSON (one request object per line),
+or a MessagePack stream / CBOR sequence, incrementally from the request body. Each item is validated and forwarded to
+WGAI on a bounded number of workers, and every result is written back the
+moment it completes. Results go out as NDJSON, or as Server-Sent Events when
+the caller sends ``Accept: text/event-stream``. Periodic ``progress`` events
+report throughput, and a final ``summary`` event closes the stream.
+
+Input is only read as fast as workers free up, and output is only produced
+as fast as the client consumes it. Memory therefore stays flat on both ends
+regardless of batch size.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+import anyio
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from app.binary import iter_binary_items, require_codec
+from app.bulkheads import Bulkhead
+from app.config import settings
+from app.deliverability import deliverability
+from app.models import format_validation_errors
+from app.scheduling import DEFAULT_TENANT
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+_DONE = object()
+
+
+@dataclass
+class ItemResult:
+    """An item's upstream result plus extra fields to put on its ``result`` event."""
+    result: dict
+    annotations: dict = field(default_factory=dict)
+
+
+class LineTooLong(ValueError):
+    """Raised when a single NDJSON line exceeds the configured maximum."""
+
+
+class BatchStreamResponse(StreamingResponse):
+    """
+        StreamingResponse that leaves ``receive`` to the body iterator.
+
+        The stock response listens for ``http.disconnect`` on a parallel
+        task. Here the iterator is still consuming the request body while it
+        writes results, so that listener would swallow body messages.
+        Disconnects are instead surfaced by ``Request.stream()`` as
+        ``ClientDisconnect``.
+        """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_lines(request: Request, max_line_bytes: int) -> AsyncIterator[tuple[int, bytes]]:
+    """
+        Yield ``(index, line)`` for each non-blank line of the request body.
+
+        Raises:
+            LineTooLong: If a line grows past ``max_line_bytes`` without a newline.
+        """
+    buffer = bytearray()
+    index = 0
+    async for chunk in request.stream():
+        buffer.extend(chunk)
+        start = 0
+        while (newline := buffer.find(b"\n", start)) >= 0:
+            line = bytes(buffer[start:newline])
+            start = newline + 1
+            if line.strip():
+                yield index, line
+                index += 1
+        del buffer[:start]
+        if len(buffer) > max_line_bytes:
+            raise LineTooLong(f"Line {index} exceeds {max_line_bytes} bytes")
+    if buffer.strip():
+        yield index, bytes(buffer)
+
+
+def iter_items(request: Request, max_item_bytes: int) -> AsyncIterator[tuple[int, bytes | object]]:
+    """
+        Pick the incremental decoder for the request's Content-Type.
+
+        Yields:
+            ``(index, raw JSON bytes)`` for NDJSON, or ``(index, decoded object)``
+            for MessagePack / CBOR bodies.
+
+        Raises:
+            HTTPException (415): For a binary Content-Type whose codec is not
+                installed; raised before the response starts.
+        """
+    codec = require_codec(request.headers.get("content-type"))
+    if codec is None:
+        return iter_lines(request, max_item_bytes)
+    return iter_binary_items(request.stream(), codec, max_item_bytes)
+
+
+def encode_event(event: dict, sse: bool) -> bytes:
+    """Serialize one event as an NDJSON line or an SSE frame."""
+    data = json.dumps(event, separators=(",", ":"))
+    if sse:
+        return f"event: {event['event']}\ndata: {data}\n\n".encode("utf-8")
+    return (data + "\n").encode("utf-8")
+
+
+async def process_batch(
+    lines: AsyncIterator[tuple[int, bytes | object]],
+    model: type[BaseModel],
+    call: Callable[[BaseModel], dict],
+    concurrency: int,
+    progress_interval: float,
+    email_field: str | None = None,
+    bulkhead: Bulkhead | None = None,
+    tenant: str = DEFAULT_TENANT,
+) -> AsyncIterator[dict]:
+    """
+        Validate and dispatch each line, yielding events as work completes.
+
+        Args:
+            lines: Source of ``(index, raw JSON or decoded object)`` items.
+            model: Pydantic model each line must satisfy.
+            call: Blocking upstream call; run on a worker thread. It may
+                return an :class:`ItemResult` to annotate the event, and an
+                ``HTTPException`` it raises is reported as ``rejected``.
+            concurrency: Maximum items in flight at once.
+            progress_interval: Seconds between ``progress`` events.
+            email_field: Model field checked for deliverability before the
+                item is sent upstream.
+            bulkhead: Phase bulkhead whose scheduler and worker threads run
+                ``call``. Items wait for a slot rather than being rejected
+                when its queue is full. Without one, the default threadpool
+                is used.
+            tenant: Scheduling tenant the items are queued under.
+
+        Yields:
+            ``result``, ``error``, ``progress`` and a final ``summary`` event.
+        """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    slots = asyncio.Semaphore(concurrency)
+    tasks: set[asyncio.Task] = set()
+    stats = {"received": 0, "succeeded": 0, "failed": 0}
+    started = time.monotonic()
+
+    async def run_item(index: int, item: BaseModel) -> None:
+        try:
+            if email_field is not None:
+                await deliverability.ensure_deliverable(getattr(item, email_field), email_field)
+            if bulkhead is not None:
+                result = await bulkhead.run(call, item, tenant=tenant, wait=True)
+            else:
+                result = await anyio.to_thread.run_sync(call, item)
+            if isinstance(result, ItemResult):
+                event = {"event": "result", "index": index, "status": "ok", "result": result.result, **result.annotations}
+            else:
+                event = {"event": "result", "index": index, "status": "ok", "result": result}
+        except HTTPException as exc:
+            event = {"event": "error", "index": index, "status": "rejected",
+                     "status_code": exc.status_code, "detail": exc.detail}
+        except RequestValidationError as exc:
+            event = {
+                "event": "error",
+                "index": index,
+                "status": "validation_error",
+                "errors": format_validation_errors(exc.errors()),
+            }
+        except Exception as exc:
+            event = {"event": "error", "index": index, "status": "upstream_error", "detail": str(exc)}
+        finally:
+            slots.release()
+        await queue.put(event)
+
+    async def produce() -> None:
+        try:
+            async for index, raw in lines:
+                stats["received"] += 1
+                try:
+                    if isinstance(raw, bytes):
+                        item = model.model_validate_json(raw)
+                    else:
+                        item = model.model_validate(raw)
+                except ValidationError as exc:
+                    await queue.put({
+                        "event": "error",
+                        "index": index,
+                        "status": "validation_error",
+                        "errors": format_validation_errors(exc.errors()),
+                    })
+                    continue
+                await slots.acquire()
+                task = asyncio.create_task(run_item(index, item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ValueError, HTTPException) as exc:
+            detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            await queue.put({"event": "error", "index": stats["received"], "status": "input_error", "detail": detail})
+        except ClientDisconnect:
+            pass
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await queue.put(_DONE)
+
+    def progress(kind: str) -> dict:
+        elapsed = time.monotonic() - started
+        completed = stats["succeeded"] + stats["failed"]
+        return {
+            "event": kind,
+            **stats,
+            "completed": completed,
+            "in_flight": len(tasks),
+            "elapsed_s": round(elapsed, 3),
+            "items_per_second": round(completed / elapsed, 3) if elapsed > 0 else 0.0,
+        }
+
+    producer = asyncio.create_task(produce())
+    next_progress = started + progress_interval
+    try:
+        while True:
+            timeout = max(next_progress - time.monotonic(), 0)
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                next_progress = time.monotonic() + progress_interval
+                yield progress("progress")
+                continue
+            if event is _DONE:
+                break
+            stats["succeeded" if event["event"] == "result" else "failed"] += 1
+            yield event
+        yield progress("summary")
+    finally:
+        producer.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+def stream_batch(request: Request, model: type[BaseModel], call: Callable[[BaseModel], dict],
+                 email_field: str | None = None, bulkhead: Bulkhead | None = None,
+                 tenant: str = DEFAULT_TENANT) -> BatchStreamResponse:
+    """
+        Build the streaming response for a batch endpoint.
+
+        Args:
+            request: Incoming request whose body is NDJSON, MessagePack or CBOR.
+            model: Pydantic model for each line.
+            call: Blocking upstream call applied to every valid item.
+            email_field: Optional model field to run deliverability checks on.
+            bulkhead: Phase bulkhead the upstream calls run in.
+            tenant: Scheduling tenant for every item.
+
+        Returns:
+            NDJSON or SSE streaming response, negotiated from ``Accept``.
+        """
+    sse = SSE_MEDIA_TYPE in request.headers.get("accept", "")
+    events = process_batch(
+        iter_items(request, settings.BATCH_MAX_LINE_BYTES),
+        model,
+        call,
+        concurrency=settings.BATCH_CONCURRENCY,
+        progress_interval=settings.BATCH_PROGRESS_INTERVAL_SECONDS,
+        email_field=email_field,
+        bulkhead=bulkhead,
+        tenant=tenant,
+    )
+
+    async def body() -> AsyncIterator[bytes]:
+        async for event in events:
+            yield encode_event(event, sse)
+
+    return BatchStreamResponse(
+        body(),
+        media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE,
+        # "identity" keeps GZipMiddleware from buffering events that must be
+        # delivered as soon as they are produced.
+        headers={"Content-Encoding": "identity", "Cache-Control": "no-cache"},
+    )
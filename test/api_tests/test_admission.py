@@ -0,0 +1,48 @@
+#File: test/api_tests/test_admission.py
+from fastapi.testclient import TestClient
+from app.main import app
+from app.admission import admission
+from app.bulkheads import PHASE1
+
+client = TestClient(app)
+
+
+class TestLoadShedding:
+    """Tests for admission control at the HTTP layer."""
+
+    def test_over_capacity_returns_503_with_retry_after(self, monkeypatch):
+        monkeypatch.setitem(admission.phase_limits, PHASE1, 0)
+        monkeypatch.setattr(admission, "retry_headroom", 0)
+
+        response = client.post("/submit/application", json={})
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(admission.retry_after)
+
+    def test_retried_request_is_admitted_from_headroom(self, monkeypatch):
+        monkeypatch.setitem(admission.phase_limits, PHASE1, 0)
+        monkeypatch.setattr(admission, "retry_headroom", 1)
+
+        response = client.post("/submit/application", json={}, headers={"Retry-Attempt": "1"})
+
+        assert response.status_code == 400
+
+    def test_health_is_never_shed(self, monkeypatch):
+        monkeypatch.setattr(admission, "max_inflight", 0)
+        monkeypatch.setitem(admission.phase_limits, PHASE1, 0)
+
+        assert client.get("/health").status_code == 200
+
+    def test_load_probe_reports_saturation(self, monkeypatch):
+        monkeypatch.setattr(admission, "max_inflight", 0)
+
+        response = client.get("/health/load")
+
+        assert response.status_code == 503
+        assert response.json()["saturated"] is True
+
+    def test_load_probe_ok_when_idle(self):
+        response = client.get("/health/load")
+
+        assert response.status_code == 200
+        assert response.json()["in_flight"] == 0
@@ -0,0 +1,130 @@
+#File: test/api_tests/test_binary_formats.py
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app import binary
+from app.client import WGAIClient
+from app.config import settings
+from app.dedup import document_fingerprint, near_duplicates
+from app.models import TechnicalAnalysisRequest
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+client = TestClient(app)
+
+INVALID_APPLICATION = {
+    "github_url": "invalid-url",
+    "background": "Short",
+    "full_name": "A",
+    "email": "bad-email",
+    "years_experience": -5,
+    "skills": [],
+    "position_applied": ""
+}
+
+ENCODERS = {
+    "application/msgpack": msgpack.packb,
+    "application/cbor": cbor2.dumps,
+}
+
+
+class TestBinaryRequestBodies:
+    """Tests for MessagePack/CBOR content negotiation."""
+
+    @pytest.mark.parametrize("media_type", list(ENCODERS))
+    def test_validation_errors_match_json(self, media_type):
+        """Test that binary bodies produce the exact same 400 payload as JSON."""
+        expected = client.post("/submit/application", json=INVALID_APPLICATION)
+
+        response = client.post(
+            "/submit/application",
+            content=ENCODERS[media_type](INVALID_APPLICATION),
+            headers={"Content-Type": media_type},
+        )
+
+        assert response.status_code == 400
+        assert response.json() == expected.json()
+
+    @pytest.mark.parametrize("media_type", list(ENCODERS))
+    def test_malformed_body_returns_validation_error(self, media_type):
+        response = client.post(
+            "/submit/application",
+            content=b"\xc1\xff\x00",
+            headers={"Content-Type": media_type},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["status"] == "validation_error"
+
+    @pytest.mark.parametrize("path", ["/submit/application", "/submit/applications/stream"])
+    def test_missing_codec_returns_415(self, monkeypatch, path):
+        """Test that a known binary type is refused, not parsed as JSON, when its codec is absent."""
+        monkeypatch.setattr(binary, "CODECS", {})
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+
+        response = client.post(path, content=msgpack.packb(INVALID_APPLICATION),
+                               headers={"Content-Type": "application/msgpack"})
+
+        assert response.status_code == 415
+
+    def test_binary_response_when_accepted(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "reuse")
+        payload = {
+            "synopsis": "Binary response negotiation synopsis " * 4,
+            "key_concepts": ["Concept1", "Concept2", "Concept3"],
+            "technical_details": ["Detail1", "Detail2", "Detail3"],
+            "analysis": "Binary response negotiation analysis text " * 6,
+            "submitted_by": "angela@example.com"
+        }
+        near_duplicates.add(document_fingerprint(TechnicalAnalysisRequest(**payload)), {"id": "prior"})
+
+        response = client.post(
+            "/analyze/tech-documents",
+            content=cbor2.dumps(payload),
+            headers={"Content-Type": "application/cbor", "Accept": "application/msgpack"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == {"id": "prior"}
+
+
+class TestBinaryBatchStreams:
+    """Tests for binary input on the streaming batch endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def fake_upstream(self, monkeypatch):
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+        monkeypatch.setattr(WGAIClient, "submit_application", lambda self, payload, api_key=None: {"id": payload.full_name})
+
+    @pytest.mark.parametrize("media_type,encode", [
+        ("application/msgpack", msgpack.packb),
+        ("application/cbor-seq", cbor2.dumps),
+    ])
+    def test_stream_of_binary_items(self, media_type, encode):
+        valid = {
+            "github_url": "https://github.com/angelatest",
+            "background": "A" * 50,
+            "full_name": "Angela Test",
+            "email": "angela@example.com",
+            "years_experience": 3,
+            "skills": ["Python"],
+            "position_applied": "Developer"
+        }
+        body = encode(valid) + encode(INVALID_APPLICATION) + encode(dict(valid, full_name="Second Person"))
+
+        response = client.post("/submit/applications/stream", content=body, headers={"Content-Type": media_type})
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        by_index = {e["index"]: e for e in events if "index" in e}
+        assert by_index[0]["result"] == {"id": "Angela Test"}
+        assert by_index[1]["status"] == "validation_error"
+        assert by_index[2]["result"] == {"id": "Second Person"}
+        assert events[-1]["received"] == 3
@@ -0,0 +1,60 @@
+#File: test/api_tests/test_body_limits.py
+import gzip
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import settings
+
+client = TestClient(app)
+
+
+class TestBodySizeLimits:
+    """Tests for per-route request body size limits."""
+
+    def test_declared_length_over_limit_returns_413(self):
+        """Test that an oversized Content-Length is refused up front."""
+        limit = settings.ROUTE_BODY_LIMITS["/submit/application"]
+
+        response = client.post(
+            "/submit/application",
+            content=b"x" * (limit + 1),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 413
+
+    def test_streamed_body_over_limit_returns_413(self):
+        """Test that a chunked body without Content-Length is cut off."""
+        limit = settings.ROUTE_BODY_LIMITS["/submit/application"]
+
+        def chunks():
+            for _ in range(limit // 1024 + 2):
+                yield b"x" * 1024
+
+        response = client.post(
+            "/submit/application",
+            content=chunks(),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 413
+
+    def test_decompressed_body_over_route_limit_returns_413(self):
+        """Test that the route limit applies to the decoded body size."""
+        limit = settings.ROUTE_BODY_LIMITS["/submit/application"]
+        body = gzip.compress(b" " * (limit + 1))
+
+        response = client.post(
+            "/submit/application",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 413
+
+    def test_body_under_limit_reaches_validation(self):
+        """Test that bodies within the limit are parsed normally."""
+        response = client.post("/submit/application", json={"skills": []})
+
+        assert response.status_code == 400
+        assert response.json()["status"] == "validation_error"
@@ -0,0 +1,180 @@
+#File: test/api_tests/test_bulkheads.py
+import threading
+
+import anyio
+import httpx
+from fastapi.testclient import TestClient
+from app.main import app
+from app.admission import admission
+from app.bulkheads import PHASE1, PHASE2, Bulkhead, bulkheads
+from app.config import settings
+from app.client import WGAIClient
+from app.scheduling import TenantScheduler, schedulers
+
+client = TestClient(app)
+
+VALID_APPLICATION = {
+    "github_url": "https://github.com/angelatest",
+    "background": "A" * 50,
+    "full_name": "Angela Test",
+    "email": "angela@example.com",
+    "years_experience": 3,
+    "skills": ["Python"],
+    "position_applied": "Developer"
+}
+
+DOCUMENT = {
+    "synopsis": "Bulkhead isolation synopsis " * 5,
+    "key_concepts": ["Concept1", "Concept2", "Concept3"],
+    "technical_details": ["Detail1", "Detail2", "Detail3"],
+    "analysis": "Bulkhead isolation analysis body " * 8,
+    "submitted_by": "angela@example.com"
+}
+
+
+def _configure(monkeypatch):
+    monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+    monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+    monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+
+
+def _single_slot(monkeypatch, phase, max_queue):
+    """Swap in a one-slot scheduler and bulkhead for ``phase``."""
+    scheduler = TenantScheduler(max_concurrency=1, tenant_max_concurrency=1)
+    bulkhead = Bulkhead(phase, scheduler, max_queue=max_queue)
+    monkeypatch.setitem(schedulers, phase, scheduler)
+    monkeypatch.setitem(bulkheads, phase, bulkhead)
+    return bulkhead
+
+
+async def _wait_for(condition, timeout=5.0):
+    with anyio.fail_after(timeout):
+        while not condition():
+            await anyio.sleep(0.005)
+
+
+class TestBulkheads:
+    """Tests for Phase 1 / Phase 2 isolation at the HTTP layer."""
+
+    def test_metrics_report_each_phase(self):
+        response = client.get("/health/bulkheads")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {PHASE1, PHASE2}
+        assert body[PHASE1]["capacity"] == settings.PHASE1_MAX_CONCURRENCY
+        assert body[PHASE2]["max_queue"] == settings.PHASE2_MAX_QUEUE
+        assert body[PHASE2]["connection_pool"]["max_connections"] == settings.PHASE2_MAX_CONCURRENCY
+
+    def test_full_phase2_returns_503_for_every_tenant(self, monkeypatch):
+        _configure(monkeypatch)
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "off")
+        release = threading.Event()
+        monkeypatch.setattr(WGAIClient, "analyze_technical_document",
+                            lambda self, payload, api_key=None: release.wait() and {"id": "doc"})
+        monkeypatch.setattr(WGAIClient, "submit_application", lambda self, payload, api_key=None: {"id": 1})
+        phase2 = _single_slot(monkeypatch, PHASE2, max_queue=2)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                def analyze(key):
+                    return http.post("/analyze/tech-documents", json=DOCUMENT, headers={"X-WGAI-API-Key": key})
+
+                async with anyio.create_task_group() as tg:
+                    try:
+                        for i in range(3):
+                            tg.start_soon(analyze, f"key-{i}")
+                        await _wait_for(lambda: phase2.active == 1 and phase2.waiting == 2)
+
+                        # A fresh key is a new tenant, but the queue limit still holds.
+                        rejected = await analyze("key-new")
+                        accepted = await http.post("/submit/application", json=VALID_APPLICATION)
+                    finally:
+                        release.set()
+            return rejected, accepted
+
+        rejected, accepted = anyio.run(main)
+
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == str(settings.SHED_RETRY_AFTER_SECONDS)
+        assert accepted.status_code == 200
+        assert accepted.json() == {"id": 1}
+        assert phase2.snapshot()["completed"] == 3
+        assert phase2.snapshot()["rejected"] == 1
+
+    def test_phase2_surge_does_not_shed_phase1(self, monkeypatch):
+        _configure(monkeypatch)
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "off")
+        release = threading.Event()
+        monkeypatch.setattr(WGAIClient, "analyze_technical_document",
+                            lambda self, payload, api_key=None: release.wait() and {"id": "doc"})
+        monkeypatch.setattr(WGAIClient, "submit_application", lambda self, payload, api_key=None: {"id": 1})
+        phase2 = _single_slot(monkeypatch, PHASE2, max_queue=2)
+        # Even with a global budget no bigger than Phase 2's, Phase 1 has its own.
+        monkeypatch.setitem(admission.phase_limits, PHASE2, 3)
+        monkeypatch.setattr(admission, "max_inflight", 3)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                def analyze(key):
+                    return http.post("/analyze/tech-documents", json=DOCUMENT, headers={"X-WGAI-API-Key": key})
+
+                async with anyio.create_task_group() as tg:
+                    try:
+                        for i in range(3):
+                            tg.start_soon(analyze, f"key-{i}")
+                        await _wait_for(lambda: admission.phase_in_flight[PHASE2] == 3 and phase2.waiting == 2)
+
+                        shed = await analyze("key-new")
+                        submitted = await http.post("/submit/application", json=VALID_APPLICATION)
+                    finally:
+                        release.set()
+            return shed, submitted
+
+        shed, submitted = anyio.run(main)
+
+        assert shed.status_code == 503
+        assert shed.json()["detail"] == "Service is at capacity, retry later"
+        assert submitted.status_code == 200
+        assert submitted.json() == {"id": 1}
+        assert admission.phase_in_flight == {PHASE1: 0, PHASE2: 0}
+
+    def test_new_tenant_is_admitted_ahead_of_backlog(self, monkeypatch):
+        _configure(monkeypatch)
+        release = threading.Event()
+        order = []
+
+        def submit_application(self, payload, api_key=None):
+            order.append(api_key)
+            release.wait()
+            return {"id": api_key}
+
+        monkeypatch.setattr(WGAIClient, "submit_application", submit_application)
+        phase1 = _single_slot(monkeypatch, PHASE1, max_queue=10)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                def post(key):
+                    return http.post("/submit/application", json=VALID_APPLICATION,
+                                     headers={"X-WGAI-API-Key": key})
+
+                async with anyio.create_task_group() as tg:
+                    try:
+                        tg.start_soon(post, "tenant-a")
+                        await _wait_for(lambda: phase1.active == 1)
+                        for _ in range(4):
+                            tg.start_soon(post, "tenant-a")
+                        await _wait_for(lambda: phase1.waiting == 4)
+                        tg.start_soon(post, "tenant-b")
+                        await _wait_for(lambda: phase1.waiting == 5)
+                    finally:
+                        release.set()
+
+        anyio.run(main)
+
+        assert len(order) == 6
+        assert order.index("tenant-b") == 1
+        assert phase1.snapshot()["rejected"] == 0
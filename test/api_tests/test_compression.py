@@ -0,0 +1,108 @@
+#File: test/api_tests/test_compression.py
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.compression import compress_payload
+
+client = TestClient(app)
+
+INVALID_APPLICATION = {
+    "github_url": "https://gitlab.com/user",
+    "background": "A" * 50,
+    "full_name": "Angela Test",
+    "email": "angela@example.com",
+    "years_experience": 3,
+    "skills": ["Python"],
+    "position_applied": "Developer"
+}
+
+
+class TestRequestDecompression:
+    """Tests for compressed request bodies and compressed responses."""
+
+    def _post(self, body: bytes, encoding: str, **headers):
+        return client.post(
+            "/submit/application",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": encoding, **headers},
+        )
+
+    def test_gzip_body_is_decoded_before_validation(self):
+        """Test that a gzip body reaches the validator as plain JSON."""
+        body = gzip.compress(json.dumps(INVALID_APPLICATION).encode())
+
+        response = self._post(body, "gzip")
+
+        assert response.status_code == 400
+        assert any(err["field"] == "github_url" for err in response.json()["errors"])
+
+    def test_deflate_body_is_decoded_before_validation(self):
+        """Test that a deflate body reaches the validator as plain JSON."""
+        body = zlib.compress(json.dumps(INVALID_APPLICATION).encode())
+
+        response = self._post(body, "deflate")
+
+        assert response.status_code == 400
+        assert response.json()["status"] == "validation_error"
+
+    def test_unsupported_encoding_returns_415(self):
+        """Test that unknown encodings are rejected without reaching the route."""
+        response = self._post(b"whatever", "compress")
+
+        assert response.status_code == 415
+
+    def test_decompression_bomb_returns_413(self):
+        """Test that bodies expanding past the configured cap are rejected."""
+        body = gzip.compress(b" " * (64 * 1024 * 1024))
+
+        response = self._post(body, "gzip")
+
+        assert response.status_code == 413
+
+    @pytest.mark.parametrize("encoding, module", [("br", "brotli"), ("zstd", "zstandard")])
+    def test_optional_codec_bomb_returns_413(self, encoding, module):
+        """Test that brotli/zstd bodies are decoded with bounded output, not in one call."""
+        codec = pytest.importorskip(module)
+        raw = b" " * (64 * 1024 * 1024)
+        body = codec.compress(raw) if encoding == "br" else codec.ZstdCompressor().compress(raw)
+
+        response = self._post(body, encoding)
+
+        assert response.status_code == 413
+
+    def test_malformed_gzip_returns_400(self):
+        """Test that a corrupt compressed stream is reported as a bad request."""
+        response = self._post(b"not really gzip", "gzip")
+
+        assert response.status_code == 400
+
+    def test_large_response_is_gzipped_when_accepted(self):
+        """Test that responses above the threshold honour Accept-Encoding."""
+        payload = dict(INVALID_APPLICATION, skills=[1] * 60)
+
+        response = client.post("/submit/application", json=payload, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 400
+        assert response.headers["content-encoding"] == "gzip"
+
+
+class TestCompressPayload:
+    """Tests for outbound payload compression."""
+
+    def test_small_payload_is_left_uncompressed(self):
+        body, encoding = compress_payload(b"{}", min_bytes=1024)
+
+        assert body == b"{}"
+        assert encoding is None
+
+    def test_large_payload_is_gzipped(self):
+        raw = b'{"analysis": "' + b"A" * 4096 + b'"}'
+
+        body, encoding = compress_payload(raw, min_bytes=1024)
+
+        assert encoding == "gzip"
+        assert gzip.decompress(body) == raw
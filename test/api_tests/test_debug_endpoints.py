@@ -0,0 +1,60 @@
+#File: test/api_tests/test_debug_endpoints.py
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import settings
+
+client = TestClient(app)
+
+
+class TestDebugEndpoints:
+    """Tests for the token-protected profiling endpoints."""
+
+    def test_hidden_when_token_not_configured(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEBUG_TOKEN", None)
+
+        response = client.get("/debug/profile/cpu", params={"seconds": 0.01})
+
+        assert response.status_code == 404
+
+    def test_wrong_token_returns_404(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEBUG_TOKEN", "secret")
+
+        response = client.get("/debug/profile/cpu", params={"seconds": 0.01}, headers={"X-Debug-Token": "nope"})
+
+        assert response.status_code == 404
+
+    def test_cpu_profile_json(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEBUG_TOKEN", "secret")
+
+        response = client.get(
+            "/debug/profile/cpu",
+            params={"seconds": 0.05, "format": "json"},
+            headers={"X-Debug-Token": "secret"},
+        )
+
+        assert response.status_code == 200
+        assert "total_samples" in response.json()
+
+    def test_cpu_profile_collapsed_download(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEBUG_TOKEN", "secret")
+
+        response = client.get(
+            "/debug/profile/cpu",
+            params={"seconds": 0.05},
+            headers={"X-Debug-Token": "secret"},
+        )
+
+        assert response.status_code == 200
+        assert "cpu.collapsed" in response.headers["content-disposition"]
+
+    def test_memory_profile(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEBUG_TOKEN", "secret")
+
+        response = client.get(
+            "/debug/profile/memory",
+            params={"seconds": 0.05, "top": 3},
+            headers={"X-Debug-Token": "secret"},
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()["top"]) <= 3
@@ -0,0 +1,34 @@
+#File: test/api_tests/test_deliverability.py
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import settings
+from app.deliverability import deliverability
+from test.unit_tests.test_deliverability import StubResolver
+
+client = TestClient(app)
+
+
+def test_undeliverable_email_domain_returns_400(monkeypatch):
+    """Test that an email on a domain without mail servers is rejected like a field error."""
+    monkeypatch.setattr(settings, "EMAIL_DELIVERABILITY_CHECK", True)
+    monkeypatch.setattr(deliverability, "_resolver", StubResolver({}))
+    payload = {
+        "github_url": "https://github.com/angelatest",
+        "background": "A" * 50,
+        "full_name": "Angela Test",
+        "email": "angela@no-such-domain.example",
+        "years_experience": 3,
+        "skills": ["Python"],
+        "position_applied": "Developer"
+    }
+
+    response = client.post("/submit/application", json=payload)
+
+    assert response.status_code == 400
+    data = response.json()
+    assert data["status"] == "validation_error"
+    assert data["errors"] == [{
+        "field": "email",
+        "message": "The domain no-such-domain.example does not accept email",
+        "type": "email_undeliverable"
+    }]
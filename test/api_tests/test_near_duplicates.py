@@ -0,0 +1,96 @@
+#File: test/api_tests/test_near_duplicates.py
+import json
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.client import WGAIClient
+from app.config import settings
+from app.dedup import document_fingerprint, near_duplicates
+from app.models import TechnicalAnalysisRequest
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "synopsis": "Near duplicate detection synopsis " * 5,
+    "key_concepts": ["Concept1", "Concept2", "Concept3"],
+    "technical_details": ["Detail1", "Detail2", "Detail3"],
+    "analysis": "Near duplicate detection analysis body " * 8,
+    "submitted_by": "angela@example.com"
+}
+
+
+class TestNearDuplicatePolicies:
+    """Tests for near-duplicate handling on the analysis endpoint."""
+
+    def test_reject_policy_returns_409(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "reject")
+        entry_id = near_duplicates.add(document_fingerprint(TechnicalAnalysisRequest(**PAYLOAD)))
+
+        response = client.post("/analyze/tech-documents", json=PAYLOAD)
+
+        assert response.status_code == 409
+        assert response.headers["X-Near-Duplicate-Of"] == str(entry_id)
+
+    def test_reuse_policy_returns_prior_result(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "reuse")
+        payload = dict(PAYLOAD, analysis="Previously analyzed document body " * 8)
+        near_duplicates.add(document_fingerprint(TechnicalAnalysisRequest(**payload)), {"id": "prior"})
+
+        response = client.post("/analyze/tech-documents", json=payload)
+
+        assert response.status_code == 200
+        assert response.json() == {"id": "prior"}
+        assert response.headers["X-Near-Duplicate-Distance"] == "0"
+
+    def test_stream_applies_policy_per_item(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "reuse")
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+        monkeypatch.setattr(WGAIClient, "analyze_technical_document", lambda self, payload, api_key=None: {"id": "fresh"})
+        payload = dict(PAYLOAD, analysis="Bulk resubmitted document body " * 8)
+        entry_id = near_duplicates.add(document_fingerprint(TechnicalAnalysisRequest(**payload)), {"id": "prior"})
+        unrelated = dict(PAYLOAD, synopsis="An entirely different synopsis text " * 4,
+                         analysis="Completely unrelated analysis contents here " * 6)
+        body = "".join(json.dumps(item) + "\n" for item in (payload, unrelated)).encode()
+
+        response = client.post("/analyze/tech-documents/stream", content=body)
+
+        events = {e["index"]: e for e in map(json.loads, response.text.splitlines()) if "index" in e}
+        assert events[0]["result"] == {"id": "prior"}
+        assert events[0]["near_duplicate_of"] == entry_id
+        assert events[1]["result"] == {"id": "fresh"}
+        assert "near_duplicate_of" not in events[1]
+
+    def test_other_tenant_does_not_get_prior_result(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "reuse")
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+        monkeypatch.setattr(WGAIClient, "analyze_technical_document",
+                            lambda self, payload, api_key=None: {"id": f"fresh-{api_key}"})
+        payload = dict(PAYLOAD, analysis="Tenant scoped document body " * 8)
+
+        first = client.post("/analyze/tech-documents", json=payload, headers={"X-WGAI-API-Key": "tenant-a"})
+        other = client.post("/analyze/tech-documents", json=payload, headers={"X-WGAI-API-Key": "tenant-b"})
+        again = client.post("/analyze/tech-documents", json=payload, headers={"X-WGAI-API-Key": "tenant-a"})
+
+        assert first.json() == {"id": "fresh-tenant-a"}
+        assert other.json() == {"id": "fresh-tenant-b"}
+        assert "X-Near-Duplicate-Of" not in other.headers
+        assert again.json() == {"id": "fresh-tenant-a"}
+        assert again.headers["X-Near-Duplicate-Distance"] == "0"
+
+    def test_reject_policy_ignores_other_tenants(self, monkeypatch):
+        monkeypatch.setattr(settings, "DEDUP_POLICY", "reject")
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+        monkeypatch.setattr(WGAIClient, "analyze_technical_document", lambda self, payload, api_key=None: {"id": "fresh"})
+        payload = dict(PAYLOAD, analysis="Rejected only for its own tenant " * 8)
+        near_duplicates.add(document_fingerprint(TechnicalAnalysisRequest(**payload)))
+
+        response = client.post("/analyze/tech-documents", json=payload, headers={"X-WGAI-API-Key": "tenant-b"})
+
+        assert response.status_code == 200
+        assert "X-Near-Duplicate-Of" not in response.headers
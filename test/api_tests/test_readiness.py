@@ -0,0 +1,37 @@
+#File: test/api_tests/test_readiness.py
+from fastapi.testclient import TestClient
+from app.main import app
+from app.readiness import readiness
+
+client = TestClient(app)
+
+
+class TestReadinessEndpoint:
+    """Tests for GET /health/ready."""
+
+    def test_ready_when_all_checks_pass(self, monkeypatch):
+        monkeypatch.setattr(readiness, "checks", {"stub": lambda: {"ok": True}})
+        readiness.check_once()
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ready"] is True
+        assert data["stale"] is False
+        assert data["age_s"] >= 0
+
+    def test_not_ready_returns_503(self, monkeypatch):
+        monkeypatch.setattr(readiness, "checks", {"config": lambda: {"ok": False, "missing": ["WGAI_SERVER_URL"]}})
+        readiness.check_once()
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"]["config"]["missing"] == ["WGAI_SERVER_URL"]
+
+    def test_liveness_unaffected(self, monkeypatch):
+        monkeypatch.setattr(readiness, "checks", {"config": lambda: {"ok": False}})
+        readiness.check_once()
+
+        assert client.get("/health").json() == {"status": "ok"}
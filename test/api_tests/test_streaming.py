@@ -0,0 +1,105 @@
+#File: test/api_tests/test_streaming.py
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.client import WGAIClient
+from app.config import settings
+
+client = TestClient(app)
+
+VALID_APPLICATION = {
+    "github_url": "https://github.com/angelatest",
+    "background": "A" * 50,
+    "full_name": "Angela Test",
+    "email": "angela@example.com",
+    "years_experience": 3,
+    "skills": ["Python"],
+    "position_applied": "Developer"
+}
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    """Configure the client and replace the upstream call with a local stub."""
+    monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+    monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+    monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+
+    def submit_application(self, payload, api_key=None):
+        if payload.full_name == "Upstream Failure":
+            raise RuntimeError("upstream unavailable")
+        return {"id": payload.full_name}
+
+    monkeypatch.setattr(WGAIClient, "submit_application", submit_application)
+
+
+def _ndjson(*items) -> bytes:
+    return b"".join(
+        (item if isinstance(item, bytes) else json.dumps(item).encode()) + b"\n" for item in items
+    )
+
+
+class TestBatchStreaming:
+    """Tests for the streaming batch endpoints."""
+
+    def test_results_are_streamed_per_item(self, fake_upstream):
+        body = _ndjson(
+            dict(VALID_APPLICATION, full_name="First Person"),
+            dict(VALID_APPLICATION, email="not-an-email"),
+            dict(VALID_APPLICATION, full_name="Upstream Failure"),
+            b"{not json",
+        )
+
+        response = client.post("/submit/applications/stream", content=body)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        by_index = {e["index"]: e for e in events if "index" in e}
+        assert by_index[0]["result"] == {"id": "First Person"}
+        assert by_index[1]["status"] == "validation_error"
+        assert any(err["field"] == "email" for err in by_index[1]["errors"])
+        assert by_index[2]["status"] == "upstream_error"
+        assert by_index[3]["status"] == "validation_error"
+        summary = events[-1]
+        assert summary["event"] == "summary"
+        assert summary["received"] == 4
+        assert summary["succeeded"] == 1
+        assert summary["failed"] == 3
+
+    def test_server_sent_events_when_requested(self, fake_upstream):
+        response = client.post(
+            "/submit/applications/stream",
+            content=_ndjson(VALID_APPLICATION),
+            headers={"Accept": "text/event-stream"},
+        )
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        assert frames[0].startswith("event: result\ndata: ")
+        assert frames[-1].startswith("event: summary\n")
+
+    def test_oversized_line_reports_input_error(self, fake_upstream, monkeypatch):
+        monkeypatch.setattr(settings, "BATCH_MAX_LINE_BYTES", 64)
+
+        response = client.post("/submit/applications/stream", content=b"x" * 1024)
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert events[0]["status"] == "input_error"
+        assert events[-1]["event"] == "summary"
+
+    def test_compressed_batch_may_exceed_default_decompression_cap(self, fake_upstream):
+        # Blank padding lines push the decoded body past the global cap while
+        # staying under the stream route's own body limit.
+        padding = (b" " * (1024 * 1024 - 1) + b"\n") * (settings.REQUEST_MAX_DECOMPRESSED_BYTES // (1024 * 1024) + 1)
+        body = gzip.compress(_ndjson(VALID_APPLICATION) + padding + _ndjson(dict(VALID_APPLICATION, full_name="Last Item")))
+
+        response = client.post("/submit/applications/stream", content=body, headers={"Content-Encoding": "gzip"})
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert response.status_code == 200
+        assert [e["result"]["id"] for e in events if e.get("status") == "ok"] == ["Angela Test", "Last Item"]
+        assert events[-1]["event"] == "summary"
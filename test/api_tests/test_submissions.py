@@ -0,0 +1,52 @@
+#File: test/api_tests/test_submissions.py
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import settings
+from app.ledger import APPLICATION, SubmissionLedger
+from app.routers import submissions
+
+client = TestClient(app, headers={"X-Ledger-Token": "ledger-secret"})
+
+
+@pytest.fixture
+def ledger(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LEDGER_TOKEN", "ledger-secret")
+    ledger = SubmissionLedger(tmp_path / "ledger.db")
+    monkeypatch.setattr(submissions, "ledger", ledger)
+    yield ledger
+    ledger.close()
+
+
+class TestSubmissionsEndpoint:
+    """Tests for GET /submissions."""
+
+    def test_lookup_by_email(self, ledger):
+        ledger.record(APPLICATION, email="angela@example.com", github_url="https://github.com/angela", upstream_id="42")
+        ledger.flush()
+
+        response = client.get("/submissions", params={"email": "angela@example.com"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert data["items"][0]["upstream_id"] == "42"
+        assert data["items"][0]["github_url"] == "https://github.com/angela"
+
+    def test_unknown_kind_returns_400(self, ledger):
+        response = client.get("/submissions", params={"kind": "other"})
+
+        assert response.status_code == 400
+        assert response.json()["status"] == "validation_error"
+
+    def test_wrong_token_returns_401(self, ledger):
+        response = client.get("/submissions", headers={"X-Ledger-Token": "wrong"})
+
+        assert response.status_code == 401
+
+    def test_hidden_when_token_not_configured(self, ledger, monkeypatch):
+        monkeypatch.setattr(settings, "LEDGER_TOKEN", None)
+
+        response = client.get("/submissions")
+
+        assert response.status_code == 404
@@ -0,0 +1,34 @@
+#File: test/api_tests/test_tenants.py
+from fastapi.testclient import TestClient
+from app.main import app
+from app.client import WGAIClient
+from app.config import settings
+
+client = TestClient(app)
+
+VALID_APPLICATION = {
+    "github_url": "https://github.com/angelatest",
+    "background": "A" * 50,
+    "full_name": "Angela Test",
+    "email": "angela@example.com",
+    "years_experience": 3,
+    "skills": ["Python"],
+    "position_applied": "Developer"
+}
+
+
+class TestTenantKeys:
+    """Tests for deriving the scheduling tenant from the caller's key header."""
+
+    def test_caller_key_is_passed_to_client(self, monkeypatch):
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "phase1")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", "phase2")
+        seen = []
+        monkeypatch.setattr(WGAIClient, "submit_application",
+                            lambda self, payload, api_key=None: seen.append(api_key) or {"id": 1})
+
+        client.post("/submit/application", json=VALID_APPLICATION, headers={"X-WGAI-API-Key": "tenant-key"})
+        client.post("/submit/application", json=VALID_APPLICATION)
+
+        assert seen == ["tenant-key", None]
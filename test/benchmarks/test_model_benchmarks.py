@@ -0,0 +1,212 @@
+# File: test/benchmarks/test_model_benchmarks.py
+"""
+Microbenchmarks for request model validation and serialization.
+
+Each case is timed and then normalized against a trivial calibration model
+measured in the same run. The comparison is therefore about relative cost,
+not machine speed. Peak allocation per call is measured with tracemalloc.
+Results are compared with ``baseline.json``. A case fails when it regresses
+by more than BENCH_TOLERANCE (time, default 35%, best of three attempts) or
+BENCH_ALLOC_TOLERANCE (memory, default 10%).
+
+Refresh the baseline after an intentional change with:
+
+    BENCH_UPDATE_BASELINE=1 pytest test/benchmarks
+"""
+
+import json
+import os
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from app.config import settings
+from app.models import ApplicationRequest, TechnicalAnalysisRequest
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+TIME_TOLERANCE = float(os.getenv("BENCH_TOLERANCE", "0.35"))
+ALLOC_TOLERANCE = float(os.getenv("BENCH_ALLOC_TOLERANCE", "0.10"))
+UPDATE_BASELINE = os.getenv("BENCH_UPDATE_BASELINE") == "1"
+# Timing noise only ever makes a case look slower, so a case is re-measured
+# and only fails if every attempt is over budget.
+ATTEMPTS = 3
+
+
+class _Calibration(BaseModel):
+    """Reference workload used to normalize timings across machines."""
+    name: str
+    count: int
+
+
+APPLICATION_PAYLOADS = {
+    "minimal": {
+        "github_url": "https://github.com/a",
+        "background": "A" * 50,
+        "full_name": "Al",
+        "email": "a@example.com",
+        "years_experience": 0,
+        "skills": ["Python"],
+        "position_applied": "D"
+    },
+    "valid": {
+        "github_url": "https://github.com/angelatest",
+        "background": "Backend engineer with five years of Python, FastAPI and PostgreSQL experience.",
+        "full_name": "Angela Test",
+        "email": "angela@example.com",
+        "years_experience": 5,
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes"],
+        "position_applied": "AI Engineer"
+    },
+    "maximal": {
+        "github_url": "https://github.com/" + "a" * 38,
+        "background": "B" * settings.MAX_TEXT_CHARS,
+        "full_name": "F" * 200,
+        "email": "angela.developer@example.com",
+        "years_experience": 50,
+        "skills": [f"skill-{i}" for i in range(settings.MAX_LIST_ITEMS)],
+        "position_applied": "P" * 200
+    },
+    "invalid": {
+        "github_url": "https://gitlab.com/user",
+        "background": "Too short",
+        "full_name": "A",
+        "email": "not-an-email",
+        "years_experience": -1,
+        "skills": ["", " "],
+        "position_applied": ""
+    },
+}
+
+TECHNICAL_PAYLOADS = {
+    "minimal": {
+        "synopsis": "S" * 100,
+        "key_concepts": ["A", "B", "C"],
+        "technical_details": ["X", "Y", "Z"],
+        "analysis": "A" * 200,
+        "submitted_by": "a@example.com"
+    },
+    "valid": {
+        "synopsis": "An overview of microservices architecture patterns and deployment strategies. " * 3,
+        "key_concepts": ["Service decomposition", "API gateway pattern", "Event-driven architecture"],
+        "technical_details": ["REST and gRPC", "Apache Kafka", "Kubernetes", "Istio service mesh"],
+        "analysis": "Microservices trade operational complexity for team autonomy and scalability. " * 5,
+        "submitted_by": "angela.developer@example.com"
+    },
+    "maximal": {
+        "synopsis": "S" * settings.MAX_TEXT_CHARS,
+        "key_concepts": [f"concept-{i}" for i in range(settings.MAX_LIST_ITEMS)],
+        "technical_details": [f"detail-{i}" for i in range(settings.MAX_LIST_ITEMS)],
+        "analysis": "A" * settings.MAX_TEXT_CHARS,
+        "submitted_by": "angela.developer@example.com"
+    },
+    "invalid": {
+        "synopsis": "Too short",
+        "key_concepts": ["Valid", ""],
+        "technical_details": ["X"],
+        "analysis": "Short",
+        "submitted_by": "bad-email"
+    },
+}
+
+MODELS = {
+    "application": (ApplicationRequest, APPLICATION_PAYLOADS),
+    "technical": (TechnicalAnalysisRequest, TECHNICAL_PAYLOADS),
+}
+
+
+def _operation(model: type[BaseModel], payload: dict, operation: str):
+    """Return a zero-argument callable performing ``operation`` once."""
+    if operation == "validate":
+        def validate():
+            try:
+                model.model_validate(payload)
+            except ValidationError:
+                pass
+        return validate
+
+    instance = model.model_validate(payload)
+    if operation == "model_dump":
+        return instance.model_dump
+    return instance.model_dump_json
+
+
+def _seconds_per_call(func) -> float:
+    """Best-of-seven timing, with the loop count auto-scaled to ~10 ms per run."""
+    timer = timeit.Timer(func)
+    number = max(1, int(0.01 / max(min(timer.repeat(repeat=3, number=1)), 1e-7)))
+    return min(timer.repeat(repeat=7, number=number)) / number
+
+
+def _calibration_seconds() -> float:
+    return _seconds_per_call(lambda: _Calibration.model_validate({"name": "calibration", "count": 1}))
+
+
+def _relative_cost(func) -> float:
+    """Cost of ``func`` in calibration units, calibrating right before and after it."""
+    before = _calibration_seconds()
+    seconds = _seconds_per_call(func)
+    after = _calibration_seconds()
+    return seconds / min(before, after)
+
+
+def _peak_alloc_bytes(func) -> int:
+    func()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _cases():
+    for model_name, (model, payloads) in MODELS.items():
+        for payload_name in payloads:
+            operations = ["validate"] if payload_name == "invalid" else ["validate", "model_dump", "model_dump_json"]
+            for operation in operations:
+                yield f"{model_name}/{payload_name}/{operation}"
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict:
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text())
+    return {}
+
+
+@pytest.mark.parametrize("case", list(_cases()))
+def test_benchmark(case, baseline):
+    model_name, payload_name, operation = case.split("/")
+    model, payloads = MODELS[model_name]
+    func = _operation(model, payloads[payload_name], operation)
+
+    measured = {
+        "relative_cost": round(_relative_cost(func), 2),
+        "alloc_bytes": _peak_alloc_bytes(func),
+    }
+
+    if UPDATE_BASELINE:
+        baseline[case] = measured
+        BASELINE_PATH.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+        return
+
+    expected = baseline.get(case)
+    if expected is None:
+        pytest.skip(f"No baseline for {case}; run with BENCH_UPDATE_BASELINE=1")
+
+    budget = expected["relative_cost"] * (1 + TIME_TOLERANCE)
+    for _ in range(ATTEMPTS - 1):
+        if measured["relative_cost"] <= budget:
+            break
+        measured["relative_cost"] = min(measured["relative_cost"], round(_relative_cost(func), 2))
+
+    assert measured["relative_cost"] <= budget, (
+        f"{case} costs {measured['relative_cost']}x calibration, baseline {expected['relative_cost']}x"
+    )
+    assert measured["alloc_bytes"] <= expected["alloc_bytes"] * (1 + ALLOC_TOLERANCE) + 256, (
+        f"{case} allocates {measured['alloc_bytes']} bytes, baseline {expected['alloc_bytes']}"
+    )
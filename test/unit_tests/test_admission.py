@@ -0,0 +1,53 @@
+# File: test/unit_tests/test_admission.py
+from app.admission import AdmissionController
+
+
+class TestAdmissionController:
+    """Unit tests for in-flight request accounting."""
+
+    def test_sheds_beyond_global_limit(self):
+        controller = AdmissionController(max_inflight=2)
+
+        assert controller.try_admit("/a", retried=False)
+        assert controller.try_admit("/b", retried=False)
+        assert not controller.try_admit("/a", retried=False)
+        assert controller.shed_total == 1
+
+    def test_route_limit_is_independent_of_global_headroom(self):
+        controller = AdmissionController(max_inflight=10, route_limits={"/slow": 1})
+
+        assert controller.try_admit("/slow", retried=False)
+        assert not controller.try_admit("/slow", retried=False)
+        assert controller.try_admit("/fast", retried=False)
+
+    def test_retried_requests_use_reserved_headroom(self):
+        controller = AdmissionController(max_inflight=1, retry_headroom=1)
+        controller.try_admit("/a", retried=False)
+
+        assert not controller.try_admit("/a", retried=False)
+        assert controller.try_admit("/a", retried=True)
+
+    def test_release_frees_capacity(self):
+        controller = AdmissionController(max_inflight=1, route_limits={"/a": 1})
+        controller.try_admit("/a", retried=False)
+        assert controller.saturated
+
+        controller.release("/a")
+
+        assert not controller.saturated
+        assert controller.snapshot()["routes"]["/a"]["in_flight"] == 0
+
+    def test_phase_routes_use_their_own_budget(self):
+        controller = AdmissionController(max_inflight=1, phase_limits={"p1": 1, "p2": 1},
+                                         phase_routes={"/p1": "p1", "/p2": "p2"})
+
+        assert controller.try_admit("/p2", retried=False)
+        assert not controller.try_admit("/p2", retried=False)
+        assert controller.try_admit("/p1", retried=False)
+        assert controller.try_admit("/other", retried=False)
+        assert controller.snapshot()["phases"]["p2"] == {"in_flight": 1, "capacity": 1, "saturated": True}
+
+        controller.release("/p2")
+
+        assert controller.phase_in_flight["p2"] == 0
+        assert controller.in_flight == 1
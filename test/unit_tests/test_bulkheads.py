@@ -0,0 +1,184 @@
+# File: test/unit_tests/test_bulkheads.py
+import threading
+
+import anyio
+import pytest
+
+from app.bulkheads import Bulkhead, BulkheadFull
+from app.scheduling import TenantScheduler
+
+
+async def _wait_for(condition, timeout=2.0):
+    with anyio.fail_after(timeout):
+        while not condition():
+            await anyio.sleep(0.005)
+
+
+def _bulkhead(max_concurrency=1, max_queue=0):
+    scheduler = TenantScheduler(max_concurrency=max_concurrency, tenant_max_concurrency=max_concurrency)
+    return Bulkhead("test", scheduler, max_queue=max_queue)
+
+
+class TestBulkhead:
+    """Unit tests for per-phase scheduling, worker threads and wait queues."""
+
+    def test_runs_blocking_call_on_worker_thread(self):
+        bulkhead = _bulkhead()
+        caller = threading.get_ident()
+
+        worker = anyio.run(bulkhead.run, threading.get_ident)
+
+        assert worker != caller
+        assert bulkhead.snapshot()["completed"] == 1
+        assert bulkhead.snapshot()["in_use"] == 0
+
+    def test_nested_client_slot_does_not_acquire_twice(self):
+        bulkhead = _bulkhead(max_concurrency=1)
+
+        def nested():
+            with bulkhead.scheduler.slot("default"):
+                return bulkhead.scheduler.snapshot()["active"]
+
+        assert anyio.run(bulkhead.run, nested) == 1
+
+    def test_queue_is_a_hard_cap_across_tenants(self):
+        bulkhead = _bulkhead(max_concurrency=1, max_queue=2)
+        release = threading.Event()
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                try:
+                    tg.start_soon(lambda: bulkhead.run(release.wait, tenant="key-0"))
+                    await _wait_for(lambda: bulkhead.active == 1)
+                    for i in (1, 2):
+                        tg.start_soon(lambda i=i: bulkhead.run(release.wait, tenant=f"key-{i}"))
+                    await _wait_for(lambda: bulkhead.waiting == 2)
+
+                    # A brand-new tenant gets no way around the limit.
+                    with pytest.raises(BulkheadFull):
+                        await bulkhead.run(release.wait, tenant="key-3")
+                    snapshot = bulkhead.snapshot()
+                finally:
+                    release.set()
+            return snapshot
+
+        snapshot = anyio.run(main)
+
+        assert snapshot["in_use"] == 1
+        assert snapshot["utilization"] == 1.0
+        assert snapshot["waiting"] == 2
+        assert snapshot["rejected"] == 1
+        assert bulkhead.snapshot()["completed"] == 3
+        assert "key-3" not in bulkhead.scheduler.snapshot()["tenants"]
+
+    def test_free_slot_is_used_even_without_queue(self):
+        bulkhead = _bulkhead(max_concurrency=2, max_queue=0)
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                for _ in range(2):
+                    tg.start_soon(bulkhead.run, lambda: None)
+
+        anyio.run(main)
+
+        assert bulkhead.snapshot()["completed"] == 2
+        assert bulkhead.snapshot()["rejected"] == 0
+
+    @pytest.mark.parametrize("max_queue", [0, 1])
+    def test_wait_holds_callers_back_until_there_is_room(self, max_queue):
+        bulkhead = _bulkhead(max_concurrency=1, max_queue=max_queue)
+        release = threading.Event()
+        peak = []
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                try:
+                    for _ in range(4):
+                        tg.start_soon(lambda: bulkhead.run(release.wait, wait=True))
+                    await _wait_for(lambda: len(bulkhead._room_waiters) == 3 - max_queue)
+                    peak.append(bulkhead.waiting)
+                finally:
+                    release.set()
+
+        anyio.run(main)
+
+        assert peak == [max_queue]
+        assert bulkhead.snapshot()["completed"] == 4
+        assert bulkhead.snapshot()["rejected"] == 0
+        assert bulkhead.snapshot()["waiting"] == 0
+
+    def test_waiting_tenant_holds_no_thread_and_fair_order_applies(self):
+        bulkhead = _bulkhead(max_concurrency=1, max_queue=8)
+        release = threading.Event()
+        order = []
+
+        def call(tenant):
+            order.append(tenant)
+            release.wait()
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(lambda: bulkhead.run(call, "bulk", tenant="bulk", wait=True))
+                await _wait_for(lambda: bulkhead.active == 1)
+                for _ in range(4):
+                    tg.start_soon(lambda: bulkhead.run(call, "bulk", tenant="bulk", wait=True))
+                await _wait_for(lambda: bulkhead.waiting == 4)
+                tg.start_soon(lambda: bulkhead.run(call, "interactive", tenant="interactive", wait=True))
+                await _wait_for(lambda: bulkhead.waiting == 5)
+                assert bulkhead._threads.borrowed_tokens == 1
+                release.set()
+
+        anyio.run(main)
+
+        assert order.index("interactive") == 1
+
+    def test_cancelled_waiter_gives_back_its_ticket(self):
+        bulkhead = _bulkhead(max_concurrency=1, max_queue=1)
+        release = threading.Event()
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(lambda: bulkhead.run(release.wait))
+                await _wait_for(lambda: bulkhead.active == 1)
+                with anyio.move_on_after(0.05):
+                    await bulkhead.run(release.wait)
+                release.set()
+            return await bulkhead.run(lambda: "done")
+
+        assert anyio.run(main) == "done"
+        assert bulkhead.snapshot()["waiting"] == 0
+        assert bulkhead.scheduler.snapshot()["active"] == 0
+
+    def test_cancelled_held_back_caller_leaves_no_waiter(self):
+        bulkhead = _bulkhead(max_concurrency=1, max_queue=0)
+        release = threading.Event()
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(lambda: bulkhead.run(release.wait))
+                await _wait_for(lambda: bulkhead.active == 1)
+                with anyio.move_on_after(0.05):
+                    await bulkhead.run(release.wait, wait=True)
+                release.set()
+            return await bulkhead.run(lambda: "done", wait=True)
+
+        assert anyio.run(main) == "done"
+        assert len(bulkhead._room_waiters) == 0
+
+    def test_saturated_bulkhead_does_not_block_another(self):
+        busy = _bulkhead(max_concurrency=1, max_queue=4)
+        idle = _bulkhead(max_concurrency=1)
+        release = threading.Event()
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(busy.run, release.wait)
+                await _wait_for(lambda: busy.active == 1 and busy.waiting == 2)
+
+                with anyio.fail_after(2):
+                    result = await idle.run(lambda: "done")
+                release.set()
+            return result
+
+        assert anyio.run(main) == "done"
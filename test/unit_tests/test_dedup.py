@@ -0,0 +1,118 @@
+# File: test/unit_tests/test_dedup.py
+import random
+
+from app.dedup import NearDuplicateIndex, document_fingerprint, simhash
+from app.models import TechnicalAnalysisRequest
+
+SYNOPSIS = (
+    "This document provides a comprehensive overview of microservices architecture patterns, "
+    "focusing on service decomposition strategies, inter-service communication protocols, and "
+    "deployment considerations for cloud-native applications."
+)
+ANALYSIS = (
+    "The microservices architecture presents significant advantages for scalability and team autonomy, "
+    "allowing independent deployment cycles and technology flexibility per service. However, it introduces "
+    "complexity in distributed system management, requiring robust observability tooling, careful API "
+    "versioning strategies, and comprehensive testing approaches across every team involved."
+)
+
+
+def _document(synopsis: str = SYNOPSIS, analysis: str = ANALYSIS) -> TechnicalAnalysisRequest:
+    return TechnicalAnalysisRequest(
+        synopsis=synopsis,
+        key_concepts=["A", "B", "C"],
+        technical_details=["X", "Y", "Z"],
+        analysis=analysis,
+        submitted_by="angela@example.com"
+    )
+
+
+class TestSimHash:
+    """Unit tests for SimHash fingerprints."""
+
+    def test_identical_text_has_identical_fingerprint(self):
+        assert simhash(ANALYSIS) == simhash(ANALYSIS)
+
+    def test_light_edit_stays_close(self):
+        """Test that a small edit moves the fingerprint by only a few bits."""
+        edited = ANALYSIS.replace("significant", "notable")
+
+        distance = (simhash(ANALYSIS) ^ simhash(edited)).bit_count()
+
+        assert distance <= 8
+
+    def test_unrelated_text_is_far(self):
+        other = " ".join(random.Random(7).choice(["alpha", "beta", "gamma", "delta", "omega"]) for _ in range(60))
+
+        distance = (simhash(ANALYSIS) ^ simhash(other)).bit_count()
+
+        assert distance > 8
+
+
+class TestNearDuplicateIndex:
+    """Unit tests for the banded near-duplicate index."""
+
+    def test_finds_near_duplicate_document(self):
+        index = NearDuplicateIndex(max_entries=10, max_distance=8)
+        entry_id = index.add(document_fingerprint(_document()), {"id": "abc"})
+
+        match = index.find(document_fingerprint(_document(analysis=ANALYSIS.replace("careful", "prudent"))))
+
+        assert match is not None
+        assert match.entry_id == entry_id
+        assert match.result == {"id": "abc"}
+
+    def test_finds_fingerprint_within_distance(self):
+        index = NearDuplicateIndex(max_entries=10, max_distance=3)
+        index.add(0b1011 << 40)
+
+        assert index.find((0b1011 << 40) ^ 0b111).distance == 3
+        assert index.find((0b1011 << 40) ^ 0b1111) is None
+
+    def test_matches_only_within_tenant(self):
+        index = NearDuplicateIndex(max_entries=10, max_distance=3)
+        entry_id = index.add(42, {"id": "abc"}, tenant="key-a")
+
+        assert index.find(42, tenant="key-b") is None
+        assert index.find(42) is None
+        assert index.find(42, tenant="key-a").entry_id == entry_id
+
+    def test_evicts_least_recently_used_entry(self):
+        index = NearDuplicateIndex(max_entries=2, max_distance=0)
+        index.add(1)
+        index.add(2)
+        index.find(1)
+        index.add(3)
+
+        assert len(index) == 2
+        assert index.find(2) is None
+        assert index.find(1) is not None
+
+    def test_result_byte_budget_drops_oldest_results_only(self):
+        index = NearDuplicateIndex(max_entries=10, max_distance=0, max_result_bytes=64)
+        index.add(1, {"id": "first"})
+        index.add(2, {"id": "second"})
+        index.add(3, {"id": "third"})
+
+        assert index.result_bytes <= 64
+        assert len(index) == 3
+        assert index.find(1).result is None
+        assert index.find(3).result == {"id": "third"}
+
+    def test_snapshot_round_trip(self, tmp_path):
+        path = tmp_path / "dedup.jsonl"
+        index = NearDuplicateIndex(max_entries=10, max_distance=3)
+        index.add(42, {"id": "abc"})
+        index.add(7, {"id": "def"}, tenant="key-a")
+        index.save(path)
+
+        restored = NearDuplicateIndex(max_entries=10, max_distance=3)
+
+        assert restored.load(path) == 2
+        assert restored.find(42).result == {"id": "abc"}
+        assert restored.find(7, tenant="key-a").result == {"id": "def"}
+
+    def test_load_missing_snapshot_is_noop(self, tmp_path):
+        index = NearDuplicateIndex(max_entries=10)
+
+        assert index.load(tmp_path / "missing.jsonl") == 0
@@ -0,0 +1,152 @@
+# File: test/unit_tests/test_deliverability.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+import dns.resolver
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from app.config import settings
+from app.deliverability import DeliverabilityChecker
+
+
+class StubResolver:
+    """Local stand-in for dns.asyncresolver.Resolver."""
+
+    def __init__(self, records: dict[tuple[str, str], object], delay: float = 0.0):
+        self.records = records
+        self.delay = delay
+        self.calls: list[tuple[str, str]] = []
+
+    async def resolve(self, name, rdtype, lifetime=None):
+        self.calls.append((name, rdtype))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        answer = self.records.get((name, rdtype), dns.resolver.NXDOMAIN())
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def _mx(*hosts):
+    return [SimpleNamespace(exchange=host, preference=10) for host in hosts]
+
+
+class TestDeliverabilityChecker:
+    """Unit tests for cached MX deliverability checks."""
+
+    def test_domain_with_mx_is_deliverable_and_cached(self):
+        resolver = StubResolver({("example.com", "MX"): _mx("mail.example.com.")})
+        checker = DeliverabilityChecker(resolver=resolver)
+
+        async def run():
+            return [await checker.is_deliverable("Example.com") for _ in range(3)]
+
+        assert asyncio.run(run()) == [True, True, True]
+        assert resolver.calls == [("example.com", "MX")]
+
+    def test_nxdomain_is_negatively_cached(self):
+        resolver = StubResolver({})
+        checker = DeliverabilityChecker(resolver=resolver)
+
+        async def run():
+            return [await checker.is_deliverable("dead.invalid") for _ in range(2)]
+
+        assert asyncio.run(run()) == [False, False]
+        assert len(resolver.calls) == 1
+
+    def test_null_mx_is_undeliverable(self):
+        resolver = StubResolver({("nomail.example", "MX"): _mx(".")})
+
+        assert asyncio.run(DeliverabilityChecker(resolver=resolver).is_deliverable("nomail.example")) is False
+
+    def test_falls_back_to_a_record_without_mx(self):
+        resolver = StubResolver({
+            ("host.example", "MX"): dns.resolver.NoAnswer(),
+            ("host.example", "A"): ["192.0.2.1"],
+        })
+
+        assert asyncio.run(DeliverabilityChecker(resolver=resolver).is_deliverable("host.example")) is True
+
+    def test_falls_back_to_aaaa_record_for_ipv6_only_domain(self):
+        resolver = StubResolver({
+            ("v6.example", "MX"): dns.resolver.NoAnswer(),
+            ("v6.example", "A"): dns.resolver.NoAnswer(),
+            ("v6.example", "AAAA"): ["2001:db8::1"],
+        })
+
+        assert asyncio.run(DeliverabilityChecker(resolver=resolver).is_deliverable("v6.example")) is True
+        assert resolver.calls[-1] == ("v6.example", "AAAA")
+
+    def test_domain_without_any_address_is_undeliverable(self):
+        resolver = StubResolver({
+            ("empty.example", "MX"): dns.resolver.NoAnswer(),
+            ("empty.example", "A"): dns.resolver.NoAnswer(),
+            ("empty.example", "AAAA"): dns.resolver.NoAnswer(),
+        })
+
+        assert asyncio.run(DeliverabilityChecker(resolver=resolver).is_deliverable("empty.example")) is False
+
+    def test_timeout_fails_open_without_caching(self):
+        resolver = StubResolver({("slow.example", "MX"): dns.resolver.LifetimeTimeout(timeout=1.0, errors={})})
+        checker = DeliverabilityChecker(resolver=resolver)
+
+        async def run():
+            return [await checker.is_deliverable("slow.example") for _ in range(2)]
+
+        assert asyncio.run(run()) == [True, True]
+        assert len(resolver.calls) == 2
+
+    def test_concurrent_lookups_share_one_query(self):
+        resolver = StubResolver({("example.com", "MX"): _mx("mail.example.com.")}, delay=0.01)
+        checker = DeliverabilityChecker(resolver=resolver)
+
+        async def run():
+            return await asyncio.gather(*(checker.is_deliverable("example.com") for _ in range(10)))
+
+        assert all(asyncio.run(run()))
+        assert len(resolver.calls) == 1
+
+    def test_timeout_covers_mx_and_a_fallback_together(self):
+        resolver = StubResolver({
+            ("host.example", "MX"): dns.resolver.NoAnswer(),
+            ("host.example", "A"): ["192.0.2.1"],
+        }, delay=0.06)
+        checker = DeliverabilityChecker(resolver=resolver, timeout=0.1)
+
+        started = time.monotonic()
+        assert asyncio.run(checker.is_deliverable("host.example")) is True
+        assert time.monotonic() - started < 0.1 + 0.05
+        assert checker._cached("host.example") is None
+
+    def test_cancelled_leader_fails_open_for_waiters(self):
+        resolver = StubResolver({("example.com", "MX"): _mx("mail.example.com.")}, delay=0.05)
+        checker = DeliverabilityChecker(resolver=resolver)
+
+        async def run():
+            leader = asyncio.create_task(checker.is_deliverable("example.com"))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(checker.is_deliverable("example.com"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(run()) is True
+
+    def test_ensure_deliverable_raises_field_error(self, monkeypatch):
+        monkeypatch.setattr(settings, "EMAIL_DELIVERABILITY_CHECK", True)
+        checker = DeliverabilityChecker(resolver=StubResolver({}))
+
+        with pytest.raises(RequestValidationError) as exc_info:
+            asyncio.run(checker.ensure_deliverable("angela@dead.invalid", "email"))
+
+        assert exc_info.value.errors()[0]["loc"] == ("body", "email")
+
+    def test_ensure_deliverable_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(settings, "EMAIL_DELIVERABILITY_CHECK", False)
+        resolver = StubResolver({})
+
+        asyncio.run(DeliverabilityChecker(resolver=resolver).ensure_deliverable("angela@dead.invalid", "email"))
+
+        assert resolver.calls == []
@@ -0,0 +1,75 @@
+# File: test/unit_tests/test_ledger.py
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.ledger import APPLICATION, TECHNICAL_ANALYSIS, SubmissionLedger
+
+
+class TestSubmissionLedger:
+    """Unit tests for the local submission ledger."""
+
+    def test_records_are_queryable_by_each_index(self, tmp_path):
+        ledger = SubmissionLedger(tmp_path / "ledger.db")
+        ledger.record(APPLICATION, email="a@example.com", github_url="https://github.com/a", upstream_id="1")
+        ledger.record(TECHNICAL_ANALYSIS, submitted_by="b@example.com", upstream_id="2")
+        ledger.flush()
+
+        assert [r["upstream_id"] for r in ledger.query(email="a@example.com")] == ["1"]
+        assert [r["upstream_id"] for r in ledger.query(github_url="https://github.com/a")] == ["1"]
+        assert [r["upstream_id"] for r in ledger.query(submitted_by="b@example.com")] == ["2"]
+        assert ledger.query(email="missing@example.com") == []
+        ledger.close()
+
+    def test_results_are_newest_first_and_limited(self, tmp_path):
+        ledger = SubmissionLedger(tmp_path / "ledger.db")
+        for i in range(5):
+            ledger.record(APPLICATION, email="a@example.com", upstream_id=str(i))
+        ledger.flush()
+
+        rows = ledger.query(email="a@example.com", limit=2)
+
+        assert [r["upstream_id"] for r in rows] == ["4", "3"]
+        ledger.close()
+
+    def test_time_range_filter(self, tmp_path):
+        ledger = SubmissionLedger(tmp_path / "ledger.db")
+        ledger.record(APPLICATION, email="a@example.com")
+        ledger.flush()
+        now = datetime.now(timezone.utc)
+
+        assert len(ledger.query(since=now - timedelta(minutes=1))) == 1
+        assert ledger.query(until=now - timedelta(minutes=1)) == []
+        ledger.close()
+
+    def test_naive_bounds_are_utc(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        ledger = SubmissionLedger(tmp_path / "ledger.db")
+        ledger.record(APPLICATION, email="a@example.com")
+        ledger.flush()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        try:
+            assert len(ledger.query(since=now - timedelta(minutes=1))) == 1
+            assert ledger.query(since=now + timedelta(minutes=1)) == []
+        finally:
+            ledger.close()
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        ledger = SubmissionLedger(tmp_path / "ledger.db", queue_size=1)
+        ledger._ensure_writer = lambda: None  # keep the writer from draining
+
+        ledger.record(APPLICATION, email="a@example.com")
+        ledger.record(APPLICATION, email="b@example.com")
+
+        assert ledger.dropped == 1
+
+    def test_close_persists_pending_rows(self, tmp_path):
+        path = tmp_path / "ledger.db"
+        ledger = SubmissionLedger(path)
+        ledger.record(APPLICATION, email="a@example.com")
+        ledger.close()
+
+        assert len(SubmissionLedger(path).query(email="a@example.com")) == 1
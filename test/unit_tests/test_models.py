@@ -1,6 +1,7 @@
 # File: test/unit_tests/test_models.py
 import pytest
 from pydantic import ValidationError
+from app.config import settings
 from app.models import ApplicationRequest, TechnicalAnalysisRequest
 
 
@@ -102,6 +103,22 @@ class TestApplicationRequest:
         errors = exc_info.value.errors()
         assert any(err["loc"] == ("skills",) for err in errors)
 
+    def test_too_many_skills_raises_validation_error(self):
+        """Test that skills longer than MAX_LIST_ITEMS raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            ApplicationRequest(
+                github_url="https://github.com/angelatest",
+                background="A" * 50,
+                full_name="Angela Test",
+                email="angela@example.com",
+                years_experience=3,
+                skills=["Python"] * (settings.MAX_LIST_ITEMS + 1),
+                position_applied="Developer"
+            )
+
+        errors = exc_info.value.errors()
+        assert any(err["loc"] == ("skills",) and err["type"] == "too_long" for err in errors)
+
 
 class TestTechnicalAnalysisRequest:
     """Unit tests for TechnicalAnalysisRequest Pydantic model."""
@@ -144,4 +161,18 @@ class TestTechnicalAnalysisRequest:
             )
 
         errors = exc_info.value.errors()
-        assert any(err["loc"] == ("key_concepts",) for err in errors)
\ No newline at end of file
+        assert any(err["loc"] == ("key_concepts",) for err in errors)
+
+    def test_too_many_technical_details_raises_validation_error(self):
+        """Test that technical_details longer than MAX_LIST_ITEMS raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            TechnicalAnalysisRequest(
+                synopsis="A" * 100,
+                key_concepts=["A", "B", "C"],
+                technical_details=["X"] * (settings.MAX_LIST_ITEMS + 1),
+                analysis="A" * 200,
+                submitted_by="angela@example.com"
+            )
+
+        errors = exc_info.value.errors()
+        assert any(err["loc"] == ("technical_details",) for err in errors)
@@ -0,0 +1,79 @@
+# File: test/unit_tests/test_profiling.py
+import pstats
+import threading
+import tracemalloc
+
+import pytest
+
+from app import profiling
+from app.profiling import ProfilerBusy, capture_cpu_profile, capture_memory_diff
+
+
+def _busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=_busy_loop, args=(stop,))
+    thread.start()
+    yield
+    stop.set()
+    thread.join()
+
+
+class TestCpuProfile:
+    """Unit tests for the sampling CPU profiler."""
+
+    def test_samples_other_threads(self, busy_thread):
+        profile = capture_cpu_profile(0.2, interval=0.005)
+
+        assert "_busy_loop" in profile.collapsed()
+        assert profile.as_dict()["total_samples"] > 0
+
+    def test_idle_threads_are_skipped(self, busy_thread):
+        stop = threading.Event()
+        idler = threading.Thread(target=stop.wait)
+        idler.start()
+        try:
+            profile = capture_cpu_profile(0.1, interval=0.005)
+        finally:
+            stop.set()
+            idler.join()
+
+        assert profile.idle_samples > 0
+        assert all(stack[-1][2] != "wait" for stack in profile.samples)
+
+    def test_pstats_export_is_loadable(self, busy_thread, tmp_path):
+        path = tmp_path / "cpu.pstats"
+        path.write_bytes(capture_cpu_profile(0.1, interval=0.005).pstats())
+
+        stats = pstats.Stats(str(path))
+
+        assert any(name == "_busy_loop" for _, _, name in stats.stats)
+
+    def test_concurrent_capture_is_rejected(self):
+        profiling._capture_lock.acquire()
+        try:
+            with pytest.raises(ProfilerBusy):
+                capture_cpu_profile(0.01)
+        finally:
+            profiling._capture_lock.release()
+
+
+class TestMemoryProfile:
+    """Unit tests for the tracemalloc snapshot diff."""
+
+    def test_reports_allocations_and_stops_tracing(self):
+        retained = []
+        timer = threading.Timer(0.02, lambda: retained.append(bytearray(1_000_000)))
+        timer.start()
+
+        report = capture_memory_diff(0.1, top=5)
+
+        timer.join()
+        assert not tracemalloc.is_tracing()
+        assert report["top"][0]["size_diff"] >= 1_000_000
+        assert set(report["top"][0]) == {"file", "line", "size_diff", "size", "count_diff", "count"}
@@ -0,0 +1,98 @@
+# File: test/unit_tests/test_readiness.py
+import time
+
+import httpx
+
+from app.bulkheads import PHASE1
+from app.client import http_pool
+from app.config import settings
+from app.readiness import ReadinessChecker, check_config, check_upstream
+
+
+class TestReadinessChecks:
+    """Unit tests for the individual readiness checks."""
+
+    def test_config_reports_missing_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        monkeypatch.setattr(settings, "API_KEY_PHASE1", "key")
+        monkeypatch.setattr(settings, "API_KEY_PHASE2", None)
+
+        result = check_config()
+
+        assert result == {"ok": False, "missing": ["WGAI_API_KEY_PHASE2"]}
+
+    def test_upstream_any_http_response_is_reachable(self, monkeypatch):
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+
+        assert check_upstream(timeout=1.0, client=client)["ok"] is True
+
+    def test_upstream_connection_error_is_not_ready(self, monkeypatch):
+        monkeypatch.setattr(settings, "WGAI_BASE_URL", "http://wgai.invalid")
+
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = httpx.Client(transport=httpx.MockTransport(refuse))
+
+        result = check_upstream(timeout=1.0, client=client)
+
+        assert result["ok"] is False
+        assert "ConnectError" in result["error"]
+
+
+class TestReadinessChecker:
+    """Unit tests for the cached background checker."""
+
+    def test_status_before_first_check_is_not_ready(self):
+        checker = ReadinessChecker(interval=10, timeout=1, checks={"noop": lambda: {"ok": True}})
+
+        assert checker.status()["ready"] is False
+
+    def test_status_serves_cached_result(self):
+        calls = []
+        checker = ReadinessChecker(interval=10, timeout=1, checks={"noop": lambda: calls.append(1) or {"ok": True}})
+        checker.check_once()
+
+        assert checker.status()["ready"] is True
+        assert checker.status()["ready"] is True
+        assert len(calls) == 1
+
+    def test_failing_or_raising_check_is_not_ready(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        checker = ReadinessChecker(interval=10, timeout=1, checks={"ok": lambda: {"ok": True}, "boom": boom})
+        checker.check_once()
+
+        status = checker.status()
+        assert status["ready"] is False
+        assert status["checks"]["boom"] == {"ok": False, "error": "boom"}
+
+    def test_stale_result_is_not_ready(self):
+        checker = ReadinessChecker(interval=0.01, timeout=1, checks={"noop": lambda: {"ok": True}})
+        checker.check_once()
+        time.sleep(0.05)
+
+        status = checker.status()
+        assert status["stale"] is True
+        assert status["ready"] is False
+
+    def test_background_thread_refreshes_result(self):
+        checker = ReadinessChecker(interval=0.01, timeout=1, checks={"noop": lambda: {"ok": True}})
+        checker.start()
+        try:
+            deadline = time.monotonic() + 2
+            while checker.status()["ready"] is not True:
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+        finally:
+            checker.stop()
+
+    def test_upstream_probe_has_its_own_client(self):
+        checker = ReadinessChecker(interval=10, timeout=1)
+        client = checker._probe_client()
+
+        assert client is not http_pool(PHASE1)
+        checker.stop()
+        assert client.is_closed
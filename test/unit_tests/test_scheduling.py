@@ -0,0 +1,126 @@
+# File: test/unit_tests/test_scheduling.py
+import threading
+import time
+
+import pytest
+
+from app.config import settings
+from app.scheduling import DEFAULT_TENANT, PHASE1, PHASE2, TenantScheduler, schedulers, tenant_label
+
+
+def _wait_for(predicate, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.001)
+
+
+def _run_queued(scheduler: TenantScheduler, tenants: list[str]) -> list[str]:
+    """Queue one request per entry behind a held slot and return grant order."""
+    order: list[str] = []
+    lock = threading.Lock()
+    gate = threading.Event()
+
+    def worker(tenant: str):
+        with scheduler.slot(tenant):
+            with lock:
+                order.append(tenant)
+
+    def holder():
+        with scheduler.slot("holder"):
+            gate.wait()
+
+    threads = [threading.Thread(target=holder)]
+    threads[0].start()
+    _wait_for(lambda: scheduler.snapshot()["active"] == 1)
+    for i, tenant in enumerate(tenants):
+        thread = threading.Thread(target=worker, args=(tenant,))
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda: sum(t["waiting"] for t in scheduler.snapshot()["tenants"].values()) == i + 1)
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=2)
+    return order
+
+
+class TestTenantLabel:
+    """Unit tests for tenant identification."""
+
+    def test_default_keys_map_to_default_tenant(self):
+        assert tenant_label(None) == DEFAULT_TENANT
+
+    def test_override_keys_are_hashed(self):
+        label = tenant_label("secret-key")
+
+        assert label.startswith("key-")
+        assert "secret" not in label
+        assert label == tenant_label("secret-key")
+
+
+class TestTenantScheduler:
+    """Unit tests for weighted fair admission."""
+
+    def test_interactive_tenant_is_not_starved_by_bulk_backlog(self):
+        scheduler = TenantScheduler(max_concurrency=1, tenant_max_concurrency=1)
+
+        order = _run_queued(scheduler, ["bulk"] * 5 + ["interactive"])
+
+        assert order.index("interactive") <= 1
+
+    def test_weights_set_relative_share(self):
+        scheduler = TenantScheduler(max_concurrency=1, tenant_max_concurrency=1, weights={"heavy": 3})
+
+        order = _run_queued(scheduler, ["light"] * 4 + ["heavy"] * 6)
+
+        assert order[:4].count("heavy") == 3
+
+    def test_tenant_concurrency_cap(self):
+        scheduler = TenantScheduler(max_concurrency=4, tenant_max_concurrency=2)
+        release = threading.Event()
+        peak = []
+
+        def worker():
+            with scheduler.slot("bulk"):
+                peak.append(scheduler.snapshot()["tenants"]["bulk"]["active"])
+                release.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: scheduler.snapshot()["tenants"].get("bulk", {}).get("waiting") == 1)
+
+        assert scheduler.snapshot()["active"] == 2
+        release.set()
+        for thread in threads:
+            thread.join(timeout=2)
+        assert max(peak) == 2
+
+    def test_snapshot_reports_queue_time(self):
+        scheduler = TenantScheduler(max_concurrency=1, tenant_max_concurrency=1, weights={"a": 1})
+
+        with scheduler.slot("a"):
+            pass
+
+        metrics = scheduler.snapshot()["tenants"]["a"]
+        assert metrics["admitted"] == 1
+        assert metrics["active"] == 0
+        assert metrics["queue_time_max_ms"] >= 0
+
+    def test_idle_override_tenants_are_evicted(self):
+        scheduler = TenantScheduler(max_concurrency=1, tenant_max_concurrency=1)
+
+        for i in range(100):
+            with scheduler.slot(tenant_label(f"key-{i}")):
+                pass
+        with scheduler.slot(DEFAULT_TENANT):
+            pass
+
+        assert list(scheduler.snapshot()["tenants"]) == [DEFAULT_TENANT]
+
+    def test_tenant_cap_defaults_to_phase_concurrency(self):
+        if settings.TENANT_MAX_CONCURRENCY:
+            pytest.skip("TENANT_MAX_CONCURRENCY is set in the environment")
+
+        assert schedulers[PHASE1].tenant_max_concurrency == settings.PHASE1_MAX_CONCURRENCY
+        assert schedulers[PHASE2].tenant_max_concurrency == settings.PHASE2_MAX_CONCURRENCY